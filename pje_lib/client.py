@@ -51,6 +51,9 @@ class PJEClient:
         self._tags = TagService(self._http)
         self._downloads = DownloadService(self._http, self.download_dir)
         self._subjects: Optional[SubjectService] = None
+        # Serviço de busca (lazy): um só por cliente, para que executores,
+        # conexão SQLite e caches sobrevivam entre buscas
+        self._search = None
         
         # Processadores (lazy initialization)
         self._number_processor: Optional[NumberProcessor] = None
@@ -87,15 +90,20 @@ class PJEClient:
     
     # PROCESSADORES (LAZY)
     
+    def _get_search_service(self):
+        """Obtém serviço de busca de processos (lazy initialization)."""
+        if self._search is None:
+            from .services.process_search_service import ProcessSearchService
+            
+            self._search = ProcessSearchService(self._http)
+        return self._search
+    
     def _get_number_processor(self) -> NumberProcessor:
         """Obtém processador de números (lazy initialization)."""
         if self._number_processor is None:
-            from .services.process_search_service import ProcessSearchService
-            
-            search_service = ProcessSearchService(self._http)
             self._number_processor = NumberProcessor(
                 self._downloads,
-                search_service,
+                self._get_search_service(),
                 self.download_dir
             )
         return self._number_processor
@@ -359,11 +367,7 @@ class PJEClient:
         if not self.ensure_logged_in():
             return None
         
-        from .services.process_search_service import ProcessSearchService
-        
-        search_service = ProcessSearchService(self._http)
-        
-        resultado = search_service.buscar_processo(
+        resultado = self._get_search_service().buscar_processo(
             numero_processo,
             usar_cache=True,
             metodos=metodos
@@ -389,10 +393,7 @@ class PJEClient:
         if not self.ensure_logged_in():
             return None
         
-        from .services.process_search_service import ProcessSearchService
-        
-        search_service = ProcessSearchService(self._http)
-        return search_service.acessar_processo_direto(id_processo, chave_acesso)
+        return self._get_search_service().acessar_processo_direto(id_processo, chave_acesso)
     
     def buscar_e_acessar_processo(
         self,
@@ -403,10 +404,7 @@ class PJEClient:
         if not self.ensure_logged_in():
             return None, None
         
-        from .services.process_search_service import ProcessSearchService
-        
-        search_service = ProcessSearchService(self._http)
-        resultado, html = search_service.buscar_e_acessar_processo(numero_processo)
+        resultado, html = self._get_search_service().buscar_e_acessar_processo(numero_processo)
         
         if resultado.encontrado:
             info = {
@@ -708,12 +706,7 @@ class PJEClient:
         
         # Tentar interromper sessão HTTP
         try:
-            self._http.session.close()
-            
-            import requests
-            from .config import DEFAULT_HEADERS
-            self._http.session = requests.Session()
-            self._http.session.headers.update(DEFAULT_HEADERS)
+            self._http.reiniciar_sessao()
             
             self.logger.info("✓ Sessão HTTP reiniciada")
         except Exception as e:
@@ -746,5 +739,8 @@ class PJEClient:
     
     def close(self):
         """Fecha conexões."""
+        if self._search is not None:
+            self._search.close()
+            self._search = None
         self._http.close()
         self.logger.info("Conexão encerrada")
\ No newline at end of file
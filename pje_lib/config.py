@@ -25,10 +25,15 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
     "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
-    "Accept-Encoding": "gzip, deflate, br",
+    # PJEHttpClient acrescenta br/zstd quando o urllib3 consegue decodificar
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
 }
 
 DEFAULT_TIMEOUT = 30
+DEFAULT_POOL_SIZE = 16
+# Teto de requisicoes por segundo ao PJE (0 desativa o limitador)
+DEFAULT_REQUESTS_PER_SECOND = 10
 DEFAULT_DELAY_MIN = 1.0
 DEFAULT_DELAY_MAX = 3.0
 MAX_SESSION_AGE_HOURS = 8
@@ -3,20 +3,108 @@ Cliente HTTP base para comunicacao com o PJE.
 """
 
 import requests
-from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from typing import Any, Dict, Optional
 
-from ..config import API_BASE, DEFAULT_HEADERS, DEFAULT_TIMEOUT
+from ..config import (
+    API_BASE, BASE_URL, DEFAULT_HEADERS, DEFAULT_TIMEOUT, DEFAULT_POOL_SIZE,
+    DEFAULT_REQUESTS_PER_SECOND,
+)
 from ..models import Usuario
+from ..utils import RateLimiter, json_loads
+
+
+# Retentativa no nivel de conexao: falhas de conexao e 502/503/504 em
+# metodos idempotentes (GET etc.; POST nao e repetido). raise_on_status=False
+# devolve a ultima resposta para o chamador tratar o status como sempre.
+_RETRY_PADRAO = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
+
+
+class _AdapterLimitado(HTTPAdapter):
+    """HTTPAdapter que passa pelo limitador de taxa antes de cada envio."""
+    
+    def __init__(self, limitador: RateLimiter, **kwargs):
+        self.limitador = limitador
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        self.limitador.aguardar()
+        return super().send(request, **kwargs)
 
 
 class PJEHttpClient:
     """Cliente HTTP configurado para o PJE."""
     
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(
+        self, timeout: int = DEFAULT_TIMEOUT, pool_size: int = DEFAULT_POOL_SIZE,
+        requests_por_segundo: float = DEFAULT_REQUESTS_PER_SECOND
+    ):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update(DEFAULT_HEADERS)
         self.usuario: Optional[Usuario] = None
+        # OTIMIZAÇÃO: o ritmo das requisicoes ao PJE e controlado aqui, num
+        # unico ponto, em vez de pausas fixas espalhadas pelos servicos
+        self.limitador = RateLimiter(requests_por_segundo)
+        self.pool_size = 0
+        self.session = self._criar_sessao()
+        self.ajustar_pool(pool_size)
+    
+    @staticmethod
+    def _criar_sessao() -> requests.Session:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        # Anuncia só as codificações que o urllib3 sabe decodificar aqui
+        # (br exige brotli instalado; sem ele a resposta viria ilegível)
+        session.headers["Accept-Encoding"] = DEFAULT_ACCEPT_ENCODING
+        return session
+    
+    def reiniciar_sessao(self):
+        """Descarta a sessão atual e cria outra com os mesmos headers e pool."""
+        self.session.close()
+        self.session = self._criar_sessao()
+        pool_size, self.pool_size = self.pool_size, 0
+        self.ajustar_pool(pool_size)
+    
+    def ajustar_pool(self, pool_size: int):
+        """
+        Garante um pool keep-alive com pelo menos pool_size conexoes por host.
+        
+        Requisicoes concorrentes reutilizam conexoes TCP/TLS abertas em vez
+        de descartar e renegociar a cada chamada. Com pool_block, um worker
+        excedente aguarda uma conexao livre do pool em vez de abrir uma
+        conexao avulsa (novo handshake TLS) que seria descartada em seguida.
+        
+        O host do PJE tem adapter proprio: o pool dele nunca e despejado
+        pelo LRU de hosts quando downloads/SSO passam por outros dominios.
+        """
+        if pool_size <= self.pool_size:
+            return
+        # Adapters substituidos (incluindo o limitado do host do PJE) fecham
+        # seus pools; do contrario as conexoes ociosas ficariam abertas
+        antigos = {id(a): a for a in self.session.adapters.values()}
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=pool_size, pool_block=True,
+            max_retries=_RETRY_PADRAO
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.mount(
+            BASE_URL,
+            _AdapterLimitado(
+                self.limitador,
+                pool_connections=1, pool_maxsize=pool_size, pool_block=True,
+                max_retries=_RETRY_PADRAO
+            )
+        )
+        self.pool_size = pool_size
+        for antigo in antigos.values():
+            antigo.close()
     
     def get_api_headers(self) -> Dict[str, str]:
         """Headers para API REST do PJE."""
@@ -45,15 +133,21 @@ class PJEHttpClient:
         kwargs.setdefault("timeout", self.timeout)
         return self.session.post(url, data=data, json=json, **kwargs)
     
-    def api_get(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
+    def api_get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> requests.Response:
         """GET request para API REST com headers corretos."""
         headers = self.get_api_headers()
-        return self.get(f"{API_BASE}/{endpoint}", params=params, headers=headers)
+        return self.get(f"{API_BASE}/{endpoint}", params=params, headers=headers, **kwargs)
     
-    def api_post(self, endpoint: str, json_data: Optional[Dict] = None) -> requests.Response:
+    def api_post(self, endpoint: str, json_data: Optional[Dict] = None, **kwargs) -> requests.Response:
         """POST request para API REST com headers corretos."""
         headers = self.get_api_headers()
-        return self.post(f"{API_BASE}/{endpoint}", json=json_data, headers=headers)
+        return self.post(f"{API_BASE}/{endpoint}", json=json_data, headers=headers, **kwargs)
+    
+    @staticmethod
+    def json(resp: requests.Response) -> Any:
+        """Decodifica o corpo JSON da resposta (orjson quando disponivel)."""
+        # OTIMIZAÇÃO: evita a deteccao de encoding e o json da stdlib de resp.json()
+        return json_loads(resp.content)
     
     def close(self):
         self.session.close()
@@ -3,7 +3,9 @@ Modelos de dados compartilhados do sistema PJE.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..utils import DATACLASS_SLOTS
 
 
 @dataclass
@@ -48,7 +50,7 @@ class Perfil:
         return " / ".join(partes)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Tarefa:
     """Tarefa no painel do usuario."""
     id: int
@@ -66,7 +68,7 @@ class Tarefa:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProcessoTarefa:
     """Processo dentro de uma tarefa."""
     id_processo: int
@@ -90,7 +92,7 @@ class ProcessoTarefa:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Etiqueta:
     """Etiqueta para organizacao de processos."""
     id: int
@@ -194,11 +196,17 @@ class DiagnosticoDownload:
     detalhes: Dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AssuntoPrincipal:
     """Assunto principal com lista de processos."""
     nome: str
     processos: List[ProcessoTarefa] = field(default_factory=list)
+    # Numeros ja adicionados (evita recriar o conjunto a cada processo) e a
+    # lista/tamanho de quando o conjunto foi montado
+    _numeros: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _indexado: Tuple[Optional[list], int] = field(
+        default=(None, -1), init=False, repr=False, compare=False
+    )
     
     @property
     def quantidade(self) -> int:
@@ -206,6 +214,12 @@ class AssuntoPrincipal:
     
     def adicionar_processo(self, processo: ProcessoTarefa) -> None:
         """Adiciona processo se não existir."""
-        numeros_existentes = {p.numero_processo for p in self.processos}
-        if processo.numero_processo not in numeros_existentes:
-            self.processos.append(processo)
\ No newline at end of file
+        lista = self.processos
+        # processos e publico: se foi reatribuido ou alterado por fora
+        # (append, remocao), o conjunto e remontado
+        if self._indexado[0] is not lista or self._indexado[1] != len(lista):
+            self._numeros = {p.numero_processo for p in lista}
+        if processo.numero_processo not in self._numeros:
+            self._numeros.add(processo.numero_processo)
+            lista.append(processo)
+        self._indexado = (lista, len(lista))
\ No newline at end of file
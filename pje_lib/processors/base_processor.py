@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Dict, Any, List, Set, Optional, Generator
 from abc import ABC, abstractmethod
 
-from ..utils import get_logger, save_json, timestamp_str
+from ..utils import get_logger, save_json, timestamp_str, RE_CNJ_ARQUIVO
 
 
 class BaseProcessor(ABC):
@@ -102,8 +102,7 @@ class BaseProcessor(ABC):
     
     def _extrair_numero_processo_arquivo(self, nome_arquivo: str) -> Optional[str]:
         """Extrai número do processo do nome do arquivo."""
-        import re
-        match = re.match(r'^(\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4})', nome_arquivo)
+        match = RE_CNJ_ARQUIVO.match(nome_arquivo)
         if match:
             return match.group(1)
         return None
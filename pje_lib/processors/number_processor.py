@@ -7,14 +7,13 @@ idProcesso e chave de acesso (ca).
 """
 
 import time
-import re
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Generator
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 from .base_processor import BaseProcessor
-from ..utils import normalizar_nome_pasta
+from ..utils import normalizar_nome_pasta, TABELA_SO_DIGITOS, parse_cnj
 
 
 class NumberProcessor(BaseProcessor):
@@ -54,11 +53,13 @@ class NumberProcessor(BaseProcessor):
         numero = numero.strip()
         
         # Se já está formatado
-        if re.match(r'^\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}$', numero):
+        if parse_cnj(numero):
             return numero
         
-        # Extrair apenas números
-        apenas_numeros = re.sub(r'[^\d]', '', numero)
+        # Extrair apenas números (translate em C em vez do motor de regex)
+        apenas_numeros = numero.translate(TABELA_SO_DIGITOS)
+        if not apenas_numeros.isascii():
+            apenas_numeros = ''.join(filter(str.isdecimal, apenas_numeros))
         
         if len(apenas_numeros) != 20:
             return None
@@ -139,6 +140,10 @@ class NumberProcessor(BaseProcessor):
                             "url_autos": resultado.url_autos
                         }
                     
+                    # Tempo esgotado dentro da busca não é ausência confirmada
+                    if resultado and resultado.inconclusivo:
+                        raise TimeoutError(f"Busca inconclusiva para {numero}")
+                    
                     self.logger.info(f"[BUSCA_TIMEOUT] ❌ Processo NÃO encontrado")
                     return None
                     
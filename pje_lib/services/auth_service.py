@@ -7,13 +7,32 @@ import re
 import time
 import shutil
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from ..config import BASE_URL, SSO_URL, API_BASE
 from ..core import SessionManager, PJEHttpClient
 from ..models import Usuario, Perfil
 from ..utils import delay, get_logger, buscar_texto_similar, extrair_viewstate
 
+# Headers fixos de formularios (evita recriar o dict a cada requisicao)
+_FORM_HEADERS_SSO = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Origin": SSO_URL,
+}
+
+_FORM_HEADERS_PERFIL = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Origin": BASE_URL,
+}
+
+_FORM_HEADERS_AJAX_PERFIS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "X-Requested-With": "XMLHttpRequest",
+    "Accept": "*/*",
+    "Origin": BASE_URL,
+    "Referer": f"{BASE_URL}/pje/ng2/dev.seam",
+}
+
 
 class AuthService:
     """Servico de autenticacao e gerenciamento de perfil."""
@@ -31,6 +50,9 @@ class AuthService:
         self._sessao_validada: bool = False
         self._cache_perfis_timestamp: float = 0
         self._cache_perfis_duracao: int = 600  # 10 minutos
+        
+        # OTIMIZAÇÃO: GET condicional da pagina de perfis (dev.seam)
+        self._dev_seam_cache = {'etag': None, 'lastmod': None, 'body': None}
     
     @property
     def usuario(self) -> Optional[Usuario]:
@@ -45,6 +67,49 @@ class AuthService:
         self._sessao_validada = False
         self._ultima_validacao = 0
     
+    def _limpar_cache_dev_seam(self):
+        """Descarta pagina de perfis em cache."""
+        self._dev_seam_cache = {'etag': None, 'lastmod': None, 'body': None}
+    
+    def _get_dev_seam(self, condicional: bool = True) -> Tuple[int, str]:
+        """
+        GET da pagina de perfis com If-None-Match/If-Modified-Since.
+        
+        Em 304 reutiliza o corpo da resposta anterior. Esse corpo serve so
+        para leitura: o ViewState JSF dele nao pode ser reenviado num POST
+        (use condicional=False antes de postar um formulario).
+        
+        Returns:
+            Tupla (status HTTP, html); 304 indica corpo vindo do cache
+        """
+        cache = self._dev_seam_cache
+        headers = {}
+        if condicional and cache['body'] is not None:
+            if cache['etag']:
+                headers["If-None-Match"] = cache['etag']
+            if cache['lastmod']:
+                headers["If-Modified-Since"] = cache['lastmod']
+        
+        resp = self.client.session.get(
+            f"{BASE_URL}/pje/ng2/dev.seam",
+            headers=headers,
+            timeout=self.client.timeout
+        )
+        
+        if resp.status_code == 304 and cache['body'] is not None:
+            self.logger.debug("dev.seam nao modificado (304), usando cache")
+            return 304, cache['body']
+        
+        if resp.status_code == 200:
+            etag = resp.headers.get("ETag")
+            lastmod = resp.headers.get("Last-Modified")
+            if etag or lastmod:
+                self._dev_seam_cache = {'etag': etag, 'lastmod': lastmod, 'body': resp.text}
+            else:
+                self._limpar_cache_dev_seam()
+        
+        return resp.status_code, resp.text
+    
     def marcar_sessao_corrompida(self):
         """Marca que foi detectada sessao corrompida."""
         self.sessao_corrompida_detectada = True
@@ -69,10 +134,10 @@ class AuthService:
             if resp.status_code == 200:
                 data = resp.json()
                 self.usuario = Usuario.from_dict(data)
-                self.logger.debug(f"Usuario atualizado: {self.usuario.nome}")
+                self.logger.debug("Usuario atualizado: %s", self.usuario.nome)
                 return True
         except Exception as e:
-            self.logger.debug(f"Erro ao verificar sessao: {e}")
+            self.logger.debug("Erro ao verificar sessao: %s", e)
         return False
     
     def atualizar_usuario(self) -> bool:
@@ -191,11 +256,7 @@ class AuthService:
                 },
                 allow_redirects=True,
                 timeout=self.client.timeout,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Origin": SSO_URL,
-                    "Referer": auth_url,
-                }
+                headers={**_FORM_HEADERS_SSO, "Referer": auth_url}
             )
             
             delay(0.5, 1)
@@ -323,6 +384,7 @@ class AuthService:
             self.limpar_flag_corrompida()
             self._invalidar_cache_validacao()
             self._cache_perfis_timestamp = 0
+            self._limpar_cache_dev_seam()
             
             self.logger.success("Reset completo concluido")
             return True
@@ -386,6 +448,7 @@ class AuthService:
         self.session_manager.clear_session()
         self.client.session.cookies.clear()
         self._invalidar_cache_validacao()
+        self._limpar_cache_dev_seam()
     
     # ... (resto dos métodos permanecem iguais: _decode_html_entities, 
     #      _extrair_perfil_favorito_do_header, _extrair_perfis_da_pagina, etc.)
@@ -408,6 +471,14 @@ class AuthService:
         nome = nome.replace("&nbsp;", " ")
         return nome.strip()
     
+    @staticmethod
+    def _separar_nome_perfil(nome: str) -> Tuple[str, str, str]:
+        """Separa 'nome / orgao / cargo' sem alocar lista intermediaria."""
+        primeiro, _, resto = nome.partition(" / ")
+        orgao, _, resto = resto.partition(" / ")
+        cargo = resto.partition(" / ")[0]
+        return primeiro, orgao, cargo
+    
     def _extrair_perfil_favorito_do_header(self, html: str) -> Optional[Perfil]:
         try:
             thead_pattern = r'<thead[^>]*class="rich-table-thead"[^>]*>.*?</thead>'
@@ -427,14 +498,15 @@ class AuthService:
             if not match:
                 return None
             
-            nome = self._decode_html_entities(match.group(1))
-            partes = nome.split(" / ")
+            nome, orgao, cargo = self._separar_nome_perfil(
+                self._decode_html_entities(match.group(1))
+            )
             
             perfil = Perfil(
                 index=-1,
-                nome=partes[0] if partes else nome,
-                orgao=partes[1] if len(partes) > 1 else "",
-                cargo=partes[2] if len(partes) > 2 else "",
+                nome=nome,
+                orgao=orgao,
+                cargo=cargo,
                 favorito=True
             )
             
@@ -458,14 +530,15 @@ class AuthService:
             matches = re.findall(pattern, html, re.IGNORECASE)
         
         for index_str, nome in matches:
-            nome = self._decode_html_entities(nome)
-            partes = nome.split(" / ")
+            nome, orgao, cargo = self._separar_nome_perfil(
+                self._decode_html_entities(nome)
+            )
             
             perfil = Perfil(
                 index=int(index_str),
-                nome=partes[0] if partes else nome,
-                orgao=partes[1] if len(partes) > 1 else "",
-                cargo=partes[2] if len(partes) > 2 else "",
+                nome=nome,
+                orgao=orgao,
+                cargo=cargo,
                 favorito=False
             )
             perfis.append(perfil)
@@ -543,13 +616,7 @@ class AuthService:
                 f"{BASE_URL}/pje/ng2/dev.seam",
                 data=form_data,
                 timeout=self.client.timeout,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "X-Requested-With": "XMLHttpRequest",
-                    "Accept": "*/*",
-                    "Origin": BASE_URL,
-                    "Referer": f"{BASE_URL}/pje/ng2/dev.seam"
-                }
+                headers=_FORM_HEADERS_AJAX_PERFIS
             )
             
             if resp.status_code == 200:
@@ -575,18 +642,13 @@ class AuthService:
         nomes_vistos = set()
 
         try:
-            resp = self.client.session.get(
-                f"{BASE_URL}/pje/ng2/dev.seam", 
-                timeout=self.client.timeout
-            )
+            status, html = self._get_dev_seam()
             
-            if resp.status_code != 200:
-                self.logger.error(f"Erro ao acessar pagina de perfis: {resp.status_code}")
+            if status not in (200, 304):
+                self.logger.error(f"Erro ao acessar pagina de perfis: {status}")
                 self.marcar_sessao_corrompida()
                 return []
             
-            html = resp.text
-            
             perfis_pagina = self._extrair_perfis_da_pagina(html)
             for perfil in perfis_pagina:
                 nome_key = perfil.nome_completo.lower()
@@ -598,6 +660,13 @@ class AuthService:
             self.logger.info(f"Pagina 1: {len(perfis_pagina)} perfis encontrados")
             
             if self._tem_paginacao_visivel(html):
+                # A paginacao posta o ViewState da pagina: precisa ser novo
+                if status == 304:
+                    status, html = self._get_dev_seam(condicional=False)
+                    if status != 200:
+                        self.logger.error(f"Erro ao acessar pagina de perfis: {status}")
+                        self.marcar_sessao_corrompida()
+                        return []
                 info_pag = self._extrair_info_paginacao(html)
                 self.logger.info(f"Paginacao detectada: {info_pag['total_paginas']} paginas")
                 
@@ -656,9 +725,11 @@ class AuthService:
         if not self.ensure_logged_in():
             return False
         try:
-            resp = self.client.session.get(f"{BASE_URL}/pje/ng2/dev.seam", timeout=self.client.timeout)
+            # GET sempre novo: o ViewState e do estado da view no servidor
+            # e nao pode vir do cache HTTP
+            _, html = self._get_dev_seam(condicional=False)
             
-            viewstate_match = re.search(r'name="javax\.faces\.ViewState"[^>]*value="([^"]*)"', resp.text)
+            viewstate_match = re.search(r'name="javax\.faces\.ViewState"[^>]*value="([^"]*)"', html)
             viewstate = viewstate_match.group(1) if viewstate_match else "j_id1"
             
             delay(0.3, 0.6)  # Delay reduzido
@@ -681,8 +752,9 @@ class AuthService:
                 data=form_data,
                 allow_redirects=True,
                 timeout=self.client.timeout,
-                headers={"Content-Type": "application/x-www-form-urlencoded", "Origin": BASE_URL}
+                headers=_FORM_HEADERS_PERFIL
             )
+            self._limpar_cache_dev_seam()
             
             delay(0.5, 1.0)  # Delay reduzido
             
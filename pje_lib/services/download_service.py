@@ -2,6 +2,7 @@
 Servico de download de processos.
 """
 
+import os
 import re
 import time
 import requests
@@ -11,7 +12,31 @@ from typing import Optional, Dict, List, Set, Tuple, Any
 from ..config import BASE_URL, TIPO_DOCUMENTO_VALUES
 from ..core import PJEHttpClient
 from ..models import DownloadDisponivel, DiagnosticoDownload
-from ..utils import delay, extrair_viewstate, current_month_year, get_logger
+from ..utils import current_month_year, get_logger
+
+# Headers fixos para POST AJAX (JSF/RichFaces)
+_FORM_HEADERS_AJAX = {
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "X-Requested-With": "XMLHttpRequest",
+    "Accept": "*/*",
+    "Origin": BASE_URL,
+}
+
+# Padroes do botao de download na pagina de autos digitais
+_RE_BOTOES_DOWNLOAD = [
+    re.compile(r'<input[^>]*id="(navbar:j_id\d+)"[^>]*onclick="iniciarTemporizadorDownload\(\)[^"]*"[^>]*value="Download"[^>]*>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<input[^>]*value="Download"[^>]*id="(navbar:j_id\d+)"[^>]*onclick="iniciarTemporizadorDownload\(\)[^"]*"[^>]*>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'id="navbar:botoesDownload"[^>]*>.*?<input[^>]*id="(navbar:j_id\d+)"[^>]*value="Download"', re.IGNORECASE | re.DOTALL),
+]
+
+# Passada unica sobre os bytes da pagina: ViewState (grupo 1) e botao de download (grupo 2)
+_RE_FORM_AUTOS = re.compile(
+    rb'name="javax\.faces\.ViewState"[^>]*value="([^"]*)"'
+    rb'|<input[^>]*id="(navbar:j_id\d+)"[^>]*onclick="iniciarTemporizadorDownload\(\)[^"]*"[^>]*value="Download"[^>]*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+_RE_URL_S3 = re.compile(r'(https://[^"\'<>\s]*\.s3\.[^"\'<>\s]*\.amazonaws\.com/[^"\'<>\s]*-processo\.pdf[^"\'<>\s]*)')
 
 
 class DownloadService:
@@ -21,9 +46,18 @@ class DownloadService:
         self.client = http_client
         self.logger = get_logger()
         self.download_dir = download_dir or Path.home() / "Downloads" / "pje_downloads"
-        self.download_dir.mkdir(parents=True, exist_ok=True)
         self.diagnosticos: List[DiagnosticoDownload] = []
         self.downloads_solicitados: Set[str] = set()
+        # Diretorios ja criados (evita mkdir a cada arquivo)
+        self._mkdir_cache: Set[Path] = set()
+        self._ensure_dir(self.download_dir)
+    
+    def _ensure_dir(self, diretorio: Path) -> None:
+        """Cria diretorio apenas na primeira vez em que e usado."""
+        if diretorio in self._mkdir_cache:
+            return
+        diretorio.mkdir(parents=True, exist_ok=True)
+        self._mkdir_cache.add(diretorio)
     
     def limpar_diagnosticos(self):
         self.diagnosticos.clear()
@@ -39,8 +73,8 @@ class DownloadService:
             self.logger.error(f"Erro ao gerar chave: {e}")
         return None
     
-    def abrir_processo(self, id_processo: int, ca: str = None) -> Optional[str]:
-        """Abre pagina de autos digitais."""
+    def _get_autos_digitais(self, id_processo: int, ca: str = None) -> Optional[requests.Response]:
+        """GET da pagina de autos digitais."""
         if not ca:
             ca = self.gerar_chave_acesso(id_processo)
             if not ca:
@@ -51,34 +85,78 @@ class DownloadService:
                 params={"idProcesso": id_processo, "ca": ca}
             )
             if resp.status_code == 200:
-                return resp.text
+                return resp
         except Exception as e:
             self.logger.error(f"Erro ao abrir processo: {e}")
         return None
     
+    def abrir_processo(self, id_processo: int, ca: str = None) -> Optional[str]:
+        """Abre pagina de autos digitais."""
+        resp = self._get_autos_digitais(id_processo, ca)
+        return resp.text if resp is not None else None
+    
+    def _extrair_dados_formulario(self, html: bytes) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extrai ViewState e ID do botao de download em uma unica passada.
+        
+        Opera sobre bytes para evitar decodificar a pagina inteira; so
+        recorre a _identificar_botao_download se o botao estiver em um
+        layout alternativo.
+        
+        Returns:
+            Tupla (viewstate, botao_id)
+        """
+        viewstate = None
+        botao_id = None
+        for match in _RE_FORM_AUTOS.finditer(html):
+            if viewstate is None and match.group(1) is not None:
+                viewstate = match.group(1).decode("utf-8", "replace")
+            elif botao_id is None and match.group(2) is not None:
+                botao_id = match.group(2).decode("ascii")
+            if viewstate is not None and botao_id is not None:
+                break
+        
+        if botao_id is None:
+            botao_id = self._identificar_botao_download(html.decode("utf-8", "replace"))
+        
+        return viewstate, botao_id
+    
     def _identificar_botao_download(self, html: str) -> Optional[str]:
         """Identifica ID do botao de download dinamicamente."""
-        patterns = [
-            re.compile(r'<input[^>]*id="(navbar:j_id\d+)"[^>]*onclick="iniciarTemporizadorDownload\(\)[^"]*"[^>]*value="Download"[^>]*>', re.IGNORECASE | re.DOTALL),
-            re.compile(r'<input[^>]*value="Download"[^>]*id="(navbar:j_id\d+)"[^>]*onclick="iniciarTemporizadorDownload\(\)[^"]*"[^>]*>', re.IGNORECASE | re.DOTALL),
-            re.compile(r'id="navbar:botoesDownload"[^>]*>.*?<input[^>]*id="(navbar:j_id\d+)"[^>]*value="Download"', re.IGNORECASE | re.DOTALL),
-        ]
-        
-        for pattern in patterns:
-            matches = pattern.findall(html)
-            if matches:
-                return matches[0]
+        for pattern in _RE_BOTOES_DOWNLOAD:
+            match = pattern.search(html)
+            if match:
+                return match.group(1)
         
         for id_botao in ['navbar:j_id280', 'navbar:j_id278', 'navbar:j_id271', 'navbar:j_id270', 'navbar:j_id267']:
             if id_botao in html:
                 return id_botao
         return None
     
+    def _gravar_resposta(self, resp: requests.Response, filepath: Path) -> None:
+        """
+        Grava corpo da resposta em disco.
+        
+        Quando o servidor informa Content-Length e a plataforma suporta
+        posix_fallocate, o arquivo e pre-alocado para evitar fragmentacao
+        e atualizacoes de metadados durante a escrita.
+        """
+        tamanho = resp.headers.get("Content-Length")
+        with open(filepath, "wb") as f:
+            if tamanho and tamanho.isdigit() and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, int(tamanho))
+                except OSError:
+                    pass
+            for chunk in resp.iter_content(chunk_size=8192):
+                f.write(chunk)
+            # Content-Length pode divergir do corpo decodificado (gzip)
+            f.truncate(f.tell())
+    
     def _extrair_url_download_direto(self, html: str) -> Optional[str]:
         """Extrai URL de download direto do S3."""
-        pattern = r'(https://[^"\'<>\s]*\.s3\.[^"\'<>\s]*\.amazonaws\.com/[^"\'<>\s]*-processo\.pdf[^"\'<>\s]*)'
-        matches = re.findall(pattern, html)
-        return matches[0].replace('&amp;', '&') if matches else None
+        match = _RE_URL_S3.search(html)
+        return match.group(1).replace('&amp;', '&') if match else None
     
     def _baixar_arquivo_direto(self, url: str, numero_processo: str, diretorio: Path) -> Optional[Path]:
         """Baixa arquivo direto do S3."""
@@ -88,11 +166,9 @@ class DownloadService:
             
             resp = requests.get(url, stream=True, timeout=120)
             if resp.status_code == 200:
-                diretorio.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(diretorio)
                 filepath = diretorio / nome
-                with open(filepath, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                self._gravar_resposta(resp, filepath)
                 self.logger.success(f"Baixado: {filepath}")
                 return filepath
         except Exception as e:
@@ -111,28 +187,28 @@ class DownloadService:
         if not ca:
             return False, detalhes
         
-        if not html_processo:
-            delay()
-            html_processo = self.abrir_processo(id_processo, ca)
-            if not html_processo:
+        if html_processo:
+            html_bytes = html_processo.encode("utf-8")
+        else:
+            resp_autos = self._get_autos_digitais(id_processo, ca)
+            if resp_autos is None:
                 return False, detalhes
+            html_bytes = resp_autos.content
         
-        viewstate = extrair_viewstate(html_processo)
+        viewstate, botao_id = self._extrair_dados_formulario(html_bytes)
         if not viewstate:
             return False, detalhes
         
-        botao_id = self._identificar_botao_download(html_processo)
         if not botao_id:
             return False, detalhes
         
-        delay()
-        
+        mes_ano = current_month_year()
         form_data = {
             "AJAXREQUEST": "_viewRoot",
             "navbar:cbTipoDocumento": TIPO_DOCUMENTO_VALUES.get(tipo_documento, "0"),
             "navbar:idDe": "", "navbar:idAte": "",
-            "navbar:dtInicioInputDate": "", "navbar:dtInicioInputCurrentDate": current_month_year(),
-            "navbar:dtFimInputDate": "", "navbar:dtFimInputCurrentDate": current_month_year(),
+            "navbar:dtInicioInputDate": "", "navbar:dtInicioInputCurrentDate": mes_ano,
+            "navbar:dtFimInputDate": "", "navbar:dtFimInputCurrentDate": mes_ano,
             "navbar:cbCronologia": "DESC", "": "on", "navbar": "navbar",
             "autoScroll": "", "javax.faces.ViewState": viewstate,
             botao_id: botao_id, "AJAX:EVENTS_COUNT": "1",
@@ -143,9 +219,7 @@ class DownloadService:
                 f"{BASE_URL}/pje/Processo/ConsultaProcesso/Detalhe/listAutosDigitais.seam",
                 data=form_data, timeout=self.client.timeout,
                 headers={
-                    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                    "X-Requested-With": "XMLHttpRequest", "Accept": "*/*",
-                    "Origin": BASE_URL,
+                    **_FORM_HEADERS_AJAX,
                     "Referer": f"{BASE_URL}/pje/Processo/ConsultaProcesso/Detalhe/listAutosDigitais.seam?idProcesso={id_processo}&ca={ca}"
                 }
             )
@@ -154,8 +228,9 @@ class DownloadService:
                 return False, detalhes
             
             texto = resp.text
+            texto_lower = texto.lower()
             
-            if "esta sendo gerado" in texto.lower() or "aguarde" in texto.lower():
+            if "esta sendo gerado" in texto_lower or "aguarde" in texto_lower:
                 url_direta = self._extrair_url_download_direto(texto)
                 if url_direta and diretorio_download:
                     arquivo = self._baixar_arquivo_direto(url_direta, numero_processo, diretorio_download)
@@ -165,12 +240,12 @@ class DownloadService:
                         self.downloads_solicitados.add(numero_processo)
                         return True, detalhes
             
-            if "sera disponibilizado" in texto.lower() or "area de download" in texto.lower():
+            if "sera disponibilizado" in texto_lower or "area de download" in texto_lower:
                 detalhes["tipo_download"] = "area_download"
                 self.downloads_solicitados.add(numero_processo)
                 return True, detalhes
             
-            if any(p in texto.lower() for p in ["download", "documento solicitado"]):
+            if any(p in texto_lower for p in ["download", "documento solicitado"]):
                 detalhes["tipo_download"] = "area_download"
                 self.downloads_solicitados.add(numero_processo)
                 return True, detalhes
@@ -209,7 +284,7 @@ class DownloadService:
     def baixar_arquivo(self, download: DownloadDisponivel, diretorio: Path = None) -> Optional[Path]:
         """Baixa arquivo da area de downloads."""
         diretorio = diretorio or self.download_dir
-        diretorio.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(diretorio)
         
         url = self.obter_url_download(download.hash_download)
         if not url:
@@ -219,9 +294,7 @@ class DownloadService:
             resp = requests.get(url, stream=True, timeout=120)
             if resp.status_code == 200:
                 filepath = diretorio / download.nome_arquivo
-                with open(filepath, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                self._gravar_resposta(resp, filepath)
                 self.logger.success(f"Baixado: {filepath}")
                 return filepath
         except Exception as e:
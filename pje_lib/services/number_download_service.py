@@ -5,32 +5,48 @@ Este serviço orquestra a busca e download de processos
 quando apenas o número CNJ é fornecido.
 """
 
+import os
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Generator, Set
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import (
+    Optional, Dict, Any, List, Generator, Iterable, Iterator, Set, Union
+)
 from dataclasses import dataclass, field
 
 from ..config import BASE_URL
 from ..core import PJEHttpClient
-from ..utils import delay, save_json, timestamp_str, get_logger
+from ..utils import (
+    delay, save_json, timestamp_str, get_logger, DATACLASS_SLOTS, RE_CNJ_ARQUIVO
+)
 from .process_search_service import ProcessSearchService, ResultadoBusca
 from .download_service import DownloadService
 
 
-@dataclass
+_EXTENSOES_ARQUIVO = ('.pdf', '.zip')
+
+# Intervalo mínimo (s) entre estados emitidos na fase 1
+_INTERVALO_MIN_YIELD = 0.1
+
+# Acima deste total, a verificação final de arquivos é paralela
+_MIN_ARQUIVOS_VERIFICACAO_PARALELA = 32
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProcessoParaDownload:
     """Representa um processo para download."""
     numero_processo: str
     id_processo: int = 0
     chave_acesso: str = ""
-    status: str = "pendente"  # pendente, buscando, encontrado, nao_encontrado, baixando, concluido, falha
+    status: str = "pendente"  # pendente, buscando, encontrado, nao_encontrado, inconclusivo, baixando, concluido, falha
     arquivo_baixado: Optional[str] = None
     erro: Optional[str] = None
     tentativas: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RelatorioDownloadNumero:
     """Relatório de download por número."""
     tipo: str = "download_por_numero"
@@ -51,9 +67,23 @@ class RelatorioDownloadNumero:
         "processos_reprocessados": [],
         "processos_falha_definitiva": []
     })
+    _arquivos_set: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def adicionar_arquivo(self, arquivo: str) -> bool:
+        """Adiciona arquivo ao relatório se ainda não estiver presente (O(1))."""
+        if arquivo in self._arquivos_set:
+            return False
+        self._arquivos_set.add(arquivo)
+        self.arquivos.append(arquivo)
+        return True
+    
+    def definir_arquivos(self, arquivos: List[str]):
+        """Substitui a lista de arquivos mantendo o índice sincronizado."""
+        self.arquivos = arquivos
+        self._arquivos_set = set(arquivos)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Converte para dicionário."""
+        """Converte para dicionário (um novo a cada chamada)."""
         return {
             "tipo": self.tipo,
             "diretorio": self.diretorio,
@@ -84,23 +114,39 @@ class NumberDownloadService:
         self,
         http_client: PJEHttpClient,
         download_service: DownloadService,
-        download_dir: Path
+        download_dir: Path,
+        search_service: Optional[ProcessSearchService] = None
     ):
         self.client = http_client
         self.download_service = download_service
         self.download_dir = download_dir
         self.logger = get_logger()
         
-        self.search_service = ProcessSearchService(http_client)
+        # Reaproveita o serviço de busca do chamador (executores e caches
+        # compartilhados); só cria e encerra um próprio se não vier nenhum
+        self._search_proprio = search_service is None
+        self.search_service = search_service or ProcessSearchService(http_client)
         
         # Configurações
         self.max_retries = 2
         self.retry_delay = 5
         self.tempo_espera_download = 60
+        self.max_workers = 8  # buscas/solicitações simultâneas na fase 1
+        
+        # Uma conexão keep-alive por worker, sem descartar sob concorrência
+        self.client.ajustar_pool(self.max_workers * 2)
+        
+        # Arquivos já confirmados como válidos nesta execução
+        self._arquivos_validos: Set[str] = set()
         
         # Controle de cancelamento
         self._cancelar = False
     
+    def close(self):
+        """Encerra o serviço de busca, se foi criado por este serviço."""
+        if self._search_proprio:
+            self.search_service.close()
+    
     def cancelar(self):
         """Solicita cancelamento do processamento."""
         self._cancelar = True
@@ -116,7 +162,7 @@ class NumberDownloadService:
     
     def processar_generator(
         self,
-        numeros: List[str],
+        numeros: Iterable[str],
         tipo_documento: str = "Selecione",
         aguardar_download: bool = True,
         tempo_espera: int = 300
@@ -124,6 +170,9 @@ class NumberDownloadService:
         """
         Processa lista de números de processos com generator.
         
+        Aceita qualquer iterável (inclusive generators), consumido uma
+        única vez.
+        
         Yields:
             Dict com estado atual do processamento
         
@@ -133,6 +182,7 @@ class NumberDownloadService:
         self._reset_cancelamento()
         self.search_service.limpar_cache()
         self.download_service.limpar_diagnosticos()
+        self._arquivos_validos.clear()
         
         # Criar diretório
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -142,109 +192,114 @@ class NumberDownloadService:
         # Inicializar relatório
         relatorio = RelatorioDownloadNumero(
             diretorio=str(diretorio),
-            data_inicio=datetime.now().isoformat(),
-            processos=len(numeros)
+            data_inicio=datetime.now().isoformat()
         )
         
-        yield relatorio.to_dict()
-        
-        self.logger.section(f"PROCESSANDO {len(numeros)} PROCESSOS POR NÚMERO")
-        
-        if not numeros:
-            relatorio.status = "concluido"
-            relatorio.erros.append("Nenhum processo informado")
-            yield relatorio.to_dict()
-            return relatorio.to_dict()
-        
         # Estrutura para controle
-        processos_controle: Dict[str, ProcessoParaDownload] = {}
+        # OTIMIZAÇÃO: lista ordenada + índice número -> posição
+        processos_controle: List[ProcessoParaDownload] = []
+        indice_controle: Dict[str, int] = {}
         for numero in numeros:
+            relatorio.processos += 1
             numero_norm = self._normalizar_numero(numero)
             if numero_norm:
-                processos_controle[numero_norm] = ProcessoParaDownload(
-                    numero_processo=numero_norm
-                )
+                if numero_norm not in indice_controle:
+                    indice_controle[numero_norm] = len(processos_controle)
+                    processos_controle.append(
+                        ProcessoParaDownload(numero_processo=numero_norm)
+                    )
             else:
                 relatorio.erros.append(f"Número inválido: {numero}")
                 relatorio.falha += 1
         
+        yield relatorio.to_dict()
+        
+        self.logger.section(f"PROCESSANDO {relatorio.processos} PROCESSOS POR NÚMERO")
+        
+        if not relatorio.processos:
+            relatorio.status = "concluido"
+            relatorio.erros.append("Nenhum processo informado")
+            yield relatorio.to_dict()
+            return relatorio.to_dict()
+        
         processos_pendentes: List[str] = []
         total = len(processos_controle)
         
-        relatorio.status = "processando"
+        relatorio.status = "buscando_processo"
+        yield relatorio.to_dict()
         
-        # Fase 1: Buscar e solicitar downloads
-        for i, (numero, proc_ctrl) in enumerate(processos_controle.items(), 1):
-            if self._check_cancelado():
-                relatorio.status = "cancelado"
-                relatorio.erros.append("Processamento cancelado pelo usuário")
-                yield relatorio.to_dict()
-                return relatorio.to_dict()
-            
-            relatorio.processo_atual = numero
-            relatorio.progresso = i
-            proc_ctrl.status = "buscando"
-            
-            self.logger.info(f"[{i}/{total}] Processando {numero}")
-            yield relatorio.to_dict()
-            
-            # Buscar processo
-            relatorio.status = "buscando_processo"
-            yield relatorio.to_dict()
-            
-            resultado_busca = self.search_service.buscar_processo(numero)
-            
-            if self._check_cancelado():
-                relatorio.status = "cancelado"
-                yield relatorio.to_dict()
-                return relatorio.to_dict()
-            
-            if not resultado_busca.encontrado:
-                proc_ctrl.status = "nao_encontrado"
-                proc_ctrl.erro = "Processo não encontrado"
-                relatorio.falha += 1
-                relatorio.erros.append(f"Processo não encontrado: {numero}")
-                relatorio.status = "processando"
-                yield relatorio.to_dict()
-                continue
-            
-            proc_ctrl.id_processo = resultado_busca.id_processo
-            proc_ctrl.chave_acesso = resultado_busca.chave_acesso
-            proc_ctrl.status = "encontrado"
-            
-            relatorio.status = "processando"
-            yield relatorio.to_dict()
-            
-            # Solicitar download
-            proc_ctrl.status = "baixando"
-            sucesso, detalhes = self.download_service.solicitar_download(
-                resultado_busca.id_processo,
-                numero,
-                tipo_documento,
-                diretorio_download=diretorio
-            )
+        # Fase 1: Buscar e solicitar downloads (concorrente)
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="pje-numero"
+        )
+        # OTIMIZAÇÃO: janela deslizante de tarefas; em lotes enormes não
+        # mantém milhares de futures vivos ao mesmo tempo
+        a_submeter = iter(processos_controle)
+        em_andamento: Dict[Future, ProcessoParaDownload] = {}
+        
+        def submeter(quantidade: int):
+            for proc in islice(a_submeter, quantidade):
+                futuro = executor.submit(
+                    self._processar_numero, proc, tipo_documento, diretorio
+                )
+                em_andamento[futuro] = proc
+        
+        try:
+            submeter(self.max_workers * 2)
             
-            if sucesso:
-                if detalhes.get("arquivo_baixado"):
-                    arquivo = Path(detalhes["arquivo_baixado"])
-                    if self._verificar_arquivo(arquivo):
-                        proc_ctrl.status = "concluido"
-                        proc_ctrl.arquivo_baixado = str(arquivo)
-                        relatorio.arquivos.append(str(arquivo))
-                        relatorio.sucesso += 1
-                        self.logger.success(f"Download concluído: {numero}")
-                    else:
-                        processos_pendentes.append(numero)
-                else:
+            i = 0
+            ultimo_yield = 0.0
+            while em_andamento:
+                concluidos, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                future = concluidos.pop()
+                proc_ctrl = em_andamento.pop(future)
+                submeter(1)
+                i += 1
+                
+                if self._check_cancelado():
+                    relatorio.status = "cancelado"
+                    relatorio.erros.append("Processamento cancelado pelo usuário")
+                    yield relatorio.to_dict()
+                    return relatorio.to_dict()
+                
+                numero = proc_ctrl.numero_processo
+                relatorio.processo_atual = numero
+                relatorio.progresso = i
+                
+                try:
+                    future.result()
+                except Exception as e:
+                    proc_ctrl.status = "falha"
+                    proc_ctrl.erro = str(e)
+                
+                self.logger.info(f"[{i}/{total}] {numero}: {proc_ctrl.status}")
+                
+                if proc_ctrl.status == "concluido":
+                    relatorio.adicionar_arquivo(proc_ctrl.arquivo_baixado)
+                    relatorio.sucesso += 1
+                    self.logger.success(f"Download concluído: {numero}")
+                elif proc_ctrl.status == "baixando":
                     processos_pendentes.append(numero)
-            else:
-                proc_ctrl.status = "falha"
-                proc_ctrl.erro = "Falha ao solicitar download"
-                relatorio.falha += 1
-                relatorio.erros.append(f"Falha ao solicitar: {numero}")
-            
-            yield relatorio.to_dict()
-            time.sleep(2)
+                elif proc_ctrl.status == "nao_encontrado":
+                    relatorio.falha += 1
+                    relatorio.erros.append(f"Processo não encontrado: {numero}")
+                elif proc_ctrl.status == "inconclusivo":
+                    relatorio.falha += 1
+                    relatorio.erros.append(f"Busca inconclusiva (tempo esgotado): {numero}")
+                else:
+                    relatorio.falha += 1
+                    relatorio.erros.append(f"Falha ao solicitar: {numero}")
+                
+                # OTIMIZAÇÃO: agrupa rajadas de conclusões num único yield
+                agora = time.monotonic()
+                if i == total or agora - ultimo_yield >= _INTERVALO_MIN_YIELD:
+                    ultimo_yield = agora
+                    yield relatorio.to_dict()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        relatorio.status = "processando"
         
         # Fase 2: Aguardar downloads pendentes
         if self._check_cancelado():
@@ -264,15 +319,15 @@ class NumberDownloadService:
             )
             
             for arq in arquivos:
-                if arq not in relatorio.arquivos:
-                    relatorio.arquivos.append(arq)
+                if relatorio.adicionar_arquivo(arq):
                     relatorio.sucesso += 1
                     
                     # Atualizar controle
                     num_proc = self._extrair_numero_do_arquivo(arq)
-                    if num_proc and num_proc in processos_controle:
-                        processos_controle[num_proc].status = "concluido"
-                        processos_controle[num_proc].arquivo_baixado = arq
+                    idx = indice_controle.get(num_proc) if num_proc else None
+                    if idx is not None:
+                        processos_controle[idx].status = "concluido"
+                        processos_controle[idx].arquivo_baixado = arq
         
         # Fase 3: Verificar integridade
         if self._check_cancelado():
@@ -284,7 +339,7 @@ class NumberDownloadService:
         relatorio.processo_atual = "Verificando arquivos"
         yield relatorio.to_dict()
         
-        processos_esperados = list(processos_controle.keys())
+        processos_esperados = list(indice_controle)
         integridade = self._verificar_integridade(processos_esperados, diretorio)
         relatorio.integridade = integridade["integridade"]
         processos_faltantes = integridade["processos_faltantes"]
@@ -309,19 +364,19 @@ class NumberDownloadService:
             
             time.sleep(self.retry_delay)
             
-            for num_proc in processos_faltantes[:]:
+            for num_proc in list(processos_faltantes):
                 if self._check_cancelado():
                     break
                 
-                proc_ctrl = processos_controle.get(num_proc)
+                idx = indice_controle.get(num_proc)
+                proc_ctrl = processos_controle[idx] if idx is not None else None
                 if not proc_ctrl or proc_ctrl.id_processo <= 0:
                     continue
                 
                 relatorio.processo_atual = f"Retry: {num_proc}"
                 proc_ctrl.tentativas += 1
-                yield relatorio.to_dict()
                 
-                sucesso, _ = self.download_service.solicitar_download(
+                sucesso, detalhes = self.download_service.solicitar_download(
                     proc_ctrl.id_processo,
                     num_proc,
                     tipo_documento,
@@ -330,36 +385,49 @@ class NumberDownloadService:
                 
                 if sucesso:
                     relatorio.retries["processos_reprocessados"].append(num_proc)
+                    # Download direto (S3) já gravou o arquivo no diretório:
+                    # não precisa esperar por ele na área de downloads
+                    arquivo = detalhes.get("arquivo_baixado")
+                    if arquivo and self._verificar_arquivo(str(arquivo)):
+                        proc_ctrl.arquivo_baixado = str(arquivo)
+                        relatorio.adicionar_arquivo(str(arquivo))
+                        processos_faltantes.discard(num_proc)
                 
+                yield relatorio.to_dict()
                 time.sleep(3)
             
             if self._check_cancelado():
                 break
             
+            if not processos_faltantes:
+                break
+            
             time.sleep(15)
             arquivos_retry = self._aguardar_e_baixar(
-                processos_faltantes, 
+                list(processos_faltantes), 
                 diretorio, 
                 tempo_espera=60
             )
             
+            # OTIMIZAÇÃO: atualiza faltantes pelo delta em vez de reler o diretório
             for arq in arquivos_retry:
-                if arq not in relatorio.arquivos:
-                    relatorio.arquivos.append(arq)
-            
+                relatorio.adicionar_arquivo(arq)
+                num_proc = self._extrair_numero_do_arquivo(arq)
+                if num_proc:
+                    processos_faltantes.discard(num_proc)
+        
+        if tentativa:
+            # Confirmação final com uma única varredura do diretório
             integridade = self._verificar_integridade(processos_esperados, diretorio)
             processos_faltantes = integridade["processos_faltantes"]
             relatorio.integridade = integridade["integridade"]
         
         if processos_faltantes:
-            relatorio.retries["processos_falha_definitiva"] = processos_faltantes
+            relatorio.retries["processos_falha_definitiva"] = sorted(processos_faltantes)
         
         # Finalização
-        arquivos_validos = [
-            a for a in relatorio.arquivos 
-            if self._verificar_arquivo(Path(a))
-        ]
-        relatorio.arquivos = arquivos_validos
+        arquivos_validos = self._filtrar_arquivos_validos(relatorio.arquivos)
+        relatorio.definir_arquivos(arquivos_validos)
         relatorio.sucesso = len(arquivos_validos)
         relatorio.falha = relatorio.processos - relatorio.sucesso
         relatorio.data_fim = datetime.now().isoformat()
@@ -388,7 +456,7 @@ class NumberDownloadService:
     
     def processar(
         self,
-        numeros: List[str],
+        numeros: Iterable[str],
         tipo_documento: str = "Selecione",
         aguardar_download: bool = True,
         tempo_espera: int = 300
@@ -406,44 +474,129 @@ class NumberDownloadService:
             relatorio = estado
         return relatorio
     
+    def _processar_numero(
+        self,
+        proc_ctrl: ProcessoParaDownload,
+        tipo_documento: str,
+        diretorio: Path
+    ) -> None:
+        """
+        Busca um processo e solicita seu download (executado em worker).
+        
+        Atualiza apenas o próprio ProcessoParaDownload; o relatório é
+        atualizado pela thread do generator.
+        """
+        if self._check_cancelado():
+            return
+        
+        numero = proc_ctrl.numero_processo
+        proc_ctrl.status = "buscando"
+        
+        resultado_busca = self.search_service.buscar_processo(numero)
+        
+        if not resultado_busca.encontrado:
+            # Tempo esgotado não prova que o processo não existe
+            if resultado_busca.inconclusivo:
+                proc_ctrl.status = "inconclusivo"
+                proc_ctrl.erro = "Busca inconclusiva (tempo esgotado)"
+            else:
+                proc_ctrl.status = "nao_encontrado"
+                proc_ctrl.erro = "Processo não encontrado"
+            return
+        
+        proc_ctrl.id_processo = resultado_busca.id_processo
+        proc_ctrl.chave_acesso = resultado_busca.chave_acesso
+        
+        if self._check_cancelado():
+            proc_ctrl.status = "encontrado"
+            return
+        
+        # Solicitar download
+        proc_ctrl.status = "baixando"
+        sucesso, detalhes = self.download_service.solicitar_download(
+            resultado_busca.id_processo,
+            numero,
+            tipo_documento,
+            diretorio_download=diretorio
+        )
+        
+        if not sucesso:
+            proc_ctrl.status = "falha"
+            proc_ctrl.erro = "Falha ao solicitar download"
+            return
+        
+        if detalhes.get("arquivo_baixado"):
+            arquivo = str(detalhes["arquivo_baixado"])
+            if self._verificar_arquivo(arquivo):
+                proc_ctrl.status = "concluido"
+                proc_ctrl.arquivo_baixado = arquivo
+        
+        # Pausa curta só desta tarefa (não serializa o lote)
+        time.sleep(0.2)
+    
     def _normalizar_numero(self, numero: str) -> Optional[str]:
-        """Normaliza número do processo."""
+        """Normaliza número do processo (memoizado no serviço de busca)."""
         return self.search_service._normalizar_numero(numero)
     
-    def _verificar_arquivo(self, filepath: Path) -> bool:
+    def _verificar_arquivo(self, filepath: Union[str, Path]) -> bool:
         """Verifica se arquivo é válido."""
-        try:
-            if not filepath.exists():
-                return False
-            if filepath.stat().st_size == 0:
-                return False
-            with open(filepath, 'rb') as f:
-                f.read(1)
+        # OTIMIZAÇÃO: arquivo concluído não muda; evita re-stat entre as fases
+        chave = str(filepath)
+        if chave in self._arquivos_validos:
             return True
-        except Exception:
+        
+        # OTIMIZAÇÃO: um único stat (antes: exists + stat + open/read)
+        try:
+            valido = os.stat(chave).st_size > 0
+        except OSError:
             return False
+        
+        if valido:
+            self._arquivos_validos.add(chave)
+        return valido
+    
+    def _filtrar_arquivos_validos(self, arquivos: List[str]) -> List[str]:
+        """Filtra arquivos válidos, verificando em paralelo lotes grandes."""
+        if len(arquivos) <= _MIN_ARQUIVOS_VERIFICACAO_PARALELA:
+            return [a for a in arquivos if self._verificar_arquivo(a)]
+        
+        # OTIMIZAÇÃO: stat é I/O (libera o GIL); em disco de rede cada
+        # chamada custa um RTT
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            resultados = executor.map(self._verificar_arquivo, arquivos)
+            return [a for a, valido in zip(arquivos, resultados) if valido]
     
     def _extrair_numero_do_arquivo(self, nome_arquivo: str) -> Optional[str]:
         """Extrai número do processo do nome do arquivo."""
-        import re
-        match = re.match(
-            r'^(\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4})', 
-            Path(nome_arquivo).name
-        )
+        # OTIMIZAÇÃO: basename só quando há separador; sem construir Path
+        if '/' in nome_arquivo or os.sep in nome_arquivo:
+            nome_arquivo = os.path.basename(nome_arquivo)
+        match = RE_CNJ_ARQUIVO.match(nome_arquivo)
         return match.group(1) if match else None
     
-    def _listar_arquivos(self, diretorio: Path) -> Set[str]:
-        """Lista arquivos válidos no diretório."""
-        arquivos = set()
-        if not diretorio.exists():
-            return arquivos
-        
-        for arquivo in diretorio.iterdir():
-            if arquivo.is_file() and arquivo.suffix.lower() in ['.pdf', '.zip']:
-                if self._verificar_arquivo(arquivo):
-                    arquivos.add(arquivo.name)
-        
-        return arquivos
+    def _iterar_arquivos(self, diretorio: Path) -> Iterator[str]:
+        """Itera nomes dos arquivos válidos no diretório."""
+        # OTIMIZAÇÃO: scandir traz o tipo do arquivo junto da listagem
+        try:
+            with os.scandir(diretorio) as it:
+                for entry in it:
+                    nome = entry.name
+                    if not nome.lower().endswith(_EXTENSOES_ARQUIVO):
+                        continue
+                    if entry.path in self._arquivos_validos:
+                        yield nome
+                        continue
+                    try:
+                        if (
+                            entry.is_file(follow_symlinks=False)
+                            and entry.stat().st_size > 0
+                        ):
+                            self._arquivos_validos.add(entry.path)
+                            yield nome
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            return
     
     def _verificar_integridade(
         self, 
@@ -451,21 +604,26 @@ class NumberDownloadService:
         diretorio: Path
     ) -> Dict[str, Any]:
         """Verifica integridade dos downloads."""
-        arquivos = self._listar_arquivos(diretorio)
-        
-        processos_baixados = set()
-        for arquivo in arquivos:
-            num = self._extrair_numero_do_arquivo(arquivo)
-            if num:
-                processos_baixados.add(num)
-        
-        processos_faltantes = set(processos_esperados) - processos_baixados
+        # OTIMIZAÇÃO: uma única passada no diretório (listagem + regex)
+        esperados = set(processos_esperados)
+        processos_baixados: Set[str] = set()
+        total_arquivos = 0
+        
+        for nome in self._iterar_arquivos(diretorio):
+            total_arquivos += 1
+            match = RE_CNJ_ARQUIVO.match(nome)
+            if match and match.group(1) in esperados:
+                processos_baixados.add(match.group(1))
+        
+        processos_faltantes = {
+            p for p in processos_esperados if p not in processos_baixados
+        }
         
         return {
             "total_esperado": len(processos_esperados),
-            "total_arquivos": len(arquivos),
+            "total_arquivos": total_arquivos,
             "processos_confirmados": len(processos_baixados),
-            "processos_faltantes": list(processos_faltantes),
+            "processos_faltantes": processos_faltantes,
             "integridade": "ok" if not processos_faltantes else "inconsistente"
         }
     
@@ -482,11 +640,14 @@ class NumberDownloadService:
         arquivos_baixados = []
         self.logger.info(f"Verificando {len(processos)} downloads pendentes")
         
-        time.sleep(5)
-        
         inicio = time.time()
         processos_restantes = set(processos)
         
+        # OTIMIZAÇÃO: backoff exponencial (1s -> 10s) em vez de espera fixa;
+        # a primeira consulta é imediata
+        espera = 1.0
+        downloads_vistos: Set[str] = set()
+        
         while processos_restantes and (time.time() - inicio) < tempo_espera:
             if self._check_cancelado():
                 break
@@ -497,18 +658,30 @@ class NumberDownloadService:
                 if self._check_cancelado():
                     break
                 
-                for num in download.get_numeros_processos():
-                    if num in processos_restantes:
-                        arquivo = self.download_service.baixar_arquivo(
-                            download, diretorio
-                        )
-                        if arquivo and self._verificar_arquivo(arquivo):
-                            arquivos_baixados.append(str(arquivo))
-                            processos_restantes.discard(num)
+                # OTIMIZAÇÃO: downloads já tratados (baixados ou sem processos
+                # de interesse) são ignorados nas próximas consultas
+                if download.hash_download in downloads_vistos:
+                    continue
+                
+                numeros = [
+                    num for num in download.get_numeros_processos()
+                    if num in processos_restantes
+                ]
+                if not numeros:
+                    downloads_vistos.add(download.hash_download)
+                    continue
+                
+                # Um único download por arquivo, mesmo com vários processos
+                arquivo = self.download_service.baixar_arquivo(download, diretorio)
+                if arquivo and self._verificar_arquivo(arquivo):
+                    downloads_vistos.add(download.hash_download)
+                    arquivos_baixados.append(str(arquivo))
+                    processos_restantes.difference_update(numeros)
             
             if processos_restantes and not self._check_cancelado():
                 self.logger.info(f"Restantes: {len(processos_restantes)}")
-                time.sleep(10)
+                time.sleep(espera)
+                espera = min(espera * 1.5, 10.0)
         
         return arquivos_baixados
     
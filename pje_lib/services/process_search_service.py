@@ -7,20 +7,194 @@ VERSÃO 2 - Com busca via API REST e salvamento de HTML para debug
 import re
 import time
 import os
+import logging
+import sqlite3
+import threading
+import traceback
+from collections import OrderedDict
+from enum import Enum
+from itertools import chain, count, islice
 from pathlib import Path
+from types import MappingProxyType
+from functools import lru_cache
+from html import unescape
+from concurrent.futures import (
+    ThreadPoolExecutor, Future, FIRST_COMPLETED, as_completed, wait,
+    TimeoutError as FutureTimeoutError
+)
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
 from dataclasses import dataclass, field
 
+import requests
+
+try:
+    import ijson
+except ImportError:  # dependência opcional
+    ijson = None
+
 from ..config import BASE_URL
 from ..core import PJEHttpClient
-from ..utils import delay, extrair_viewstate, get_logger
+from ..utils import (
+    extrair_viewstate, get_logger, json_loads, DATACLASS_SLOTS,
+    TABELA_SO_DIGITOS, parse_cnj
+)
+from .task_service import endpoint_processos_tarefa
 
 # Diretório para salvar HTMLs de debug
 DEBUG_HTML_DIR = Path.home() / "pje_debug_html"
 
+# No modo AMOSTRA, salva 1 a cada N respostas (além das com erro)
+_AMOSTRA_DEBUG_HTML = 20
+
+# Cache persistente de buscas (número CNJ -> idProcesso) entre execuções,
+# separado por instância do PJE e usuário; a chave de acesso (ca) nunca é
+# gravada em disco, é gerada de novo a cada acerto
+CACHE_BUSCA_PATH = Path.home() / ".cache" / "pje" / "busca.sqlite"
+CACHE_BUSCA_TTL = 7 * 24 * 3600  # segundos
+
+# Estratégias de busca executadas simultaneamente
+_MAX_WORKERS_ESTRATEGIAS = 12
+
+# Tempo máximo (s) de um método sem progresso. O relógio de cada método
+# começa quando ele entra em execução (a espera na fila não conta) e é
+# renovado a cada consulta concluída
+TIMEOUT_POR_METODO = 15.0
+
+# Teto (s) de uma busca inteira, incluindo a espera dos métodos na fila
+TIMEOUT_MAXIMO_BUSCA = 120.0
+
+# Endpoints de API que responderam 404/403 (e nunca acertaram) ficam
+# fora da sondagem por este período (s)
+ENDPOINT_NEGATIVO_TTL = 3600
+
+# Validade (s) do ViewState reaproveitado; a sessão JSF expira em ~30 min
+VIEWSTATE_TTL = 25 * 60
+
+# Consultas simultâneas (tarefas/etiquetas) compartilhadas entre buscas
+_MAX_WORKERS_CONSULTAS = 16
+
+# Validade (s) das listagens do painel por processo (retentativas próximas)
+_PAINEL_TTL = 30
+
+# Resultados mantidos no cache em memória (LRU; o restante fica no SQLite)
+_MAX_CACHE_RESULTADOS = 512
+
+# Processos buscados ao mesmo tempo em buscar_e_acessar_processos
+_MAX_PROCESSOS_EM_LOTE = 8
+
+# Máximo de GETs de etiquetas em voo por busca (as demais aguardam vaga)
+_MAX_ETIQUETAS_EM_VOO = 6
 
-@dataclass
+# Validade (s) do índice número -> processo de cada etiqueta lida por
+# inteiro; buscas em lote consultam o índice em vez de refazer o GET
+_ETIQUETA_INDICE_TTL = 60
+
+# Validade (s) e limite do cache de chaves de acesso geradas (por idProcesso)
+_CHAVE_ACESSO_TTL = 300
+_MAX_CACHE_CHAVES = 1024
+
+# Campos em que a entidade do painel pode trazer a chave de acesso pronta
+_CAMPOS_CHAVE_ACESSO = ("chaveAcesso", "chaveProcesso", "ca")
+
+# Dicas número CNJ -> etiqueta em que o processo foi encontrado (LRU)
+_MAX_DICAS_ETIQUETA = 1024
+
+# Caracteres re-examinados entre blocos ao ler respostas em streaming
+_SOBREPOSICAO_STREAM = 512
+
+# Campos fixos do formulário de consulta (fPP); cada busca só acrescenta
+# as partes do número, o botão e o ViewState
+_SEM_SELECAO = "org.jboss.seam.ui.NoSelectionConverter.noSelectionValue"
+_FORMULARIO_CONSULTA = MappingProxyType({
+    "AJAXREQUEST": "_viewRoot",
+    "fPP": "fPP",
+    "fPP:j_id150:nomeParte": "",
+    "fPP:decorationDados:ufOABCombo": _SEM_SELECAO,
+    "fPP:jurisdicaoComboDecoration:jurisdicaoCombo": _SEM_SELECAO,
+    "fPP:orgaoJulgadorComboDecoration:orgaoJulgadorCombo": _SEM_SELECAO,
+    "fPP:processoReferenciaDecoration:habilitarMascaraProcessoReferencia": "true",
+    "fPP:dataAutuacaoDecoration:dataAutuacaoInicioInputCurrentDate": "",
+    "fPP:dataAutuacaoDecoration:dataAutuacaoFimInputCurrentDate": "",
+    "tipoMascaraDocumento": "on",
+    "AJAX:EVENTS_COUNT": "1",
+})
+_FORMULARIO_CLIQUE = MappingProxyType({
+    "AJAXREQUEST": "_viewRoot",
+    "fPP": "fPP",
+    "AJAX:EVENTS_COUNT": "1",
+})
+_HEADERS_AJAX_CONSULTA = MappingProxyType({
+    "Content-Type": "application/x-www-form-urlencoded",
+    "X-Requested-With": "XMLHttpRequest",
+    "Origin": BASE_URL,
+    "Referer": f"{BASE_URL}/pje/Processo/ConsultaProcesso/listView.seam?iframe=true",
+})
+# Página de autos: a sessão já anuncia gzip/deflate e reaproveita a conexão
+# keep-alive das chamadas à API; aqui só entram os headers de navegação
+_HEADERS_ACESSO_DIRETO = MappingProxyType({
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Referer": f"{BASE_URL}/pje/Processo/ConsultaProcesso/listView.seam?iframe=true",
+})
+
+# OTIMIZAÇÃO: padrões compilados uma única vez (caminho quente da busca)
+_RE_LINHA_TABELA = re.compile(r'fPP:processosTable:(\d+):j_id(\d+)')
+_RE_TAGS = re.compile(r'<[^>]*>')
+_RE_LINK_AUTOS = re.compile(
+    r'listAutosDigitais\.seam\?idProcesso=(\d+)(?:&amp;|&)ca=([a-f0-9]+)'
+)
+_RE_ID_PROCESSO = re.compile(r'idProcesso["\']?\s*[:=]\s*["\']?(\d+)')
+# idProcesso (JSON ou query string) ou "id" JSON numa única passada
+_RE_ID_RESPOSTA = re.compile(
+    r'idProcesso["\']?\s*[:=]\s*["\']?(\d+)|"id"\s*:\s*(\d+)'
+)
+_BOTAO_PESQUISA_PADRAO = "fPP:j_id455"
+# Botão de pesquisa: atributo submit/Pesquisar logo após o id, ou no
+# mesmo elemento (sem sair da tag) - tudo numa única passada
+_RE_BOTAO_PESQUISA = re.compile(
+    r'(fPP:j_id\d+)"\s*(?:type="submit"|value="Pesquisar")'
+    r'|(fPP:j_id\d+)[^<>]{0,200}?Pesquisar'
+    r'|name="(fPP:j_id\d+)"[^<>]{0,200}?submit',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _formatar_cnj(numero: str) -> Tuple[Optional[str], int]:
+    """
+    Formata um número de processo no padrão CNJ (memoizado).
+    
+    Returns:
+        Tupla (número formatado ou None, quantidade de dígitos encontrada)
+    """
+    numero = numero.strip()
+    
+    if parse_cnj(numero):
+        return numero, 20
+    
+    # OTIMIZAÇÃO: translate remove não-dígitos Latin-1 numa passada em C;
+    # sobras não-ASCII (ex.: travessão colado) caem no filtro genérico
+    apenas_numeros = numero.translate(TABELA_SO_DIGITOS)
+    if not apenas_numeros.isascii():
+        apenas_numeros = ''.join(filter(str.isdecimal, apenas_numeros))
+    
+    if len(apenas_numeros) != 20:
+        return None, len(apenas_numeros)
+    
+    return (
+        f"{apenas_numeros[:7]}-{apenas_numeros[7:9]}."
+        f"{apenas_numeros[9:13]}.{apenas_numeros[13]}."
+        f"{apenas_numeros[14:16]}.{apenas_numeros[16:20]}"
+    ), 20
+
+
+def _fechar_resposta(future: Future) -> None:
+    """Fecha a resposta de um future concluído sem que ninguém a tenha lido."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ResultadoBusca:
     """Resultado de uma busca de processo."""
     encontrado: bool = False
@@ -29,6 +203,8 @@ class ResultadoBusca:
     chave_acesso: str = ""
     metodo_busca: str = ""
     detalhes: Dict[str, Any] = field(default_factory=dict)
+    # Busca encerrada por tempo esgotado: não encontrado não é definitivo
+    inconclusivo: bool = False
     
     @property
     def url_autos(self) -> Optional[str]:
@@ -46,36 +222,143 @@ class ResultadoBusca:
         return None
 
 
+class _ProgressoMetodo:
+    """Relógio de um método de busca: começa quando ele entra em execução."""
+    __slots__ = ("inicio", "atividade")
+    
+    def __init__(self):
+        self.inicio: Optional[float] = None
+        self.atividade = 0.0
+    
+    def marcar(self):
+        self.atividade = time.monotonic()
+
+
+class ModoDebugHtml(str, Enum):
+    """Quais respostas HTML são salvas para debug."""
+    NUNCA = "nunca"
+    EM_ERRO = "em_erro"
+    SEMPRE = "sempre"
+    AMOSTRA = "amostra"
+
+
 class ProcessSearchService:
     """
     Serviço para busca de processos por número.
     """
     
-    def __init__(self, http_client: PJEHttpClient, salvar_debug_html: bool = True):
+    def __init__(
+        self,
+        http_client: PJEHttpClient,
+        salvar_debug_html: Union[bool, ModoDebugHtml] = ModoDebugHtml.EM_ERRO,
+        cache_persistente: bool = True
+    ):
         self.client = http_client
         self.logger = get_logger()
-        self._cache_resultados: Dict[str, ResultadoBusca] = {}
-        self.salvar_debug_html = salvar_debug_html
+        # Cache L1 em memória, limitado (LRU) para sessões longas da GUI
+        self._cache_resultados: "OrderedDict[str, ResultadoBusca]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Etiqueta em que cada processo foi visto por último (mesmo lock)
+        self._dicas_etiqueta: "OrderedDict[str, str]" = OrderedDict()
+        # Chaves de acesso geradas: id -> (chave, instante) (mesmo lock)
+        self._cache_chaves: "OrderedDict[int, Tuple[str, float]]" = OrderedDict()
+        
+        # Cache L2 em disco (SQLite), na frente da busca HTTP
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        
+        # Estatísticas por endpoint da API: chave -> [acertos, falhas, último 404/403]
+        self._stats_endpoints: Dict[str, List[float]] = {}
+        self._stats_lock = threading.Lock()
+        if cache_persistente:
+            self._abrir_cache_persistente(CACHE_BUSCA_PATH)
+        # bool mantido por compatibilidade: True = SEMPRE, False = NUNCA
+        if isinstance(salvar_debug_html, bool):
+            salvar_debug_html = ModoDebugHtml.SEMPRE if salvar_debug_html else ModoDebugHtml.NUNCA
+        self.modo_debug_html = ModoDebugHtml(salvar_debug_html)
+        self.salvar_debug_html = self.modo_debug_html is not ModoDebugHtml.NUNCA
+        self._contador_debug = count()
         self._debug_dir = DEBUG_HTML_DIR
         
+        # Buscas em andamento (single-flight por número + métodos)
+        self._buscas_em_andamento: Dict[Tuple[str, Tuple[str, ...]], Future] = {}
+        self._buscas_lock = threading.Lock()
+        
+        # Tempo máximo (s) de um método em execução sem progresso
+        self.timeout_por_metodo = TIMEOUT_POR_METODO
+        # Progresso do método de busca executado pela thread atual
+        self._progresso_local = threading.local()
+        
+        # Último ViewState da consulta por thread: (viewstate, botão de
+        # pesquisa, timestamp). O estado JSF da view guarda a última busca
+        # feita nela; compartilhado entre threads, um clique poderia
+        # abrir o processo pesquisado por outra busca
+        self._viewstate_local = threading.local()
+        # Listagens do painel: (número, favoritas) -> (timestamp, tarefas)
+        # (protegido por _cache_lock, assim como o índice de etiquetas)
+        self._cache_painel: Dict[Tuple[str, bool], Tuple[float, List[Dict[str, Any]]]] = {}
+        # Processos por etiqueta: id -> (timestamp, numeroProcesso -> processo)
+        self._indice_etiquetas: Dict[int, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+        
+        # ID do botão de pesquisa: só muda quando o PJE é reimplantado
+        self._botao_pesquisa = ""
+        
+        # OTIMIZAÇÃO: executores compartilhados por toda a vida do serviço.
+        # Estratégias e consultas-folha (POST/GET por tarefa/etiqueta) ficam
+        # em pools separados: uma estratégia que espera consultas nunca
+        # ocupa a vaga de que elas precisam (sem deadlock)
+        self._executor = ThreadPoolExecutor(
+            max_workers=_MAX_WORKERS_ESTRATEGIAS,
+            thread_name_prefix="pje-busca"
+        )
+        self._executor_consultas = ThreadPoolExecutor(
+            max_workers=_MAX_WORKERS_CONSULTAS,
+            thread_name_prefix="pje-consulta"
+        )
+        self.client.ajustar_pool(_MAX_WORKERS_ESTRATEGIAS + _MAX_WORKERS_CONSULTAS)
+        
+        # Uma única thread grava os HTMLs de debug, em ordem de chegada
+        self._executor_debug = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="pje-debug-html"
+        )
+        
         # Criar diretório de debug se necessário
         if self.salvar_debug_html:
             self._debug_dir.mkdir(parents=True, exist_ok=True)
             self.logger.info(f"[DEBUG] HTMLs serão salvos em: {self._debug_dir}")
     
-    def _salvar_html_debug(self, html: str, prefixo: str, numero_processo: str = "") -> Optional[Path]:
+    def _deve_salvar_html(self, erro: bool) -> bool:
+        """Aplica o modo de debug à resposta atual."""
+        modo = self.modo_debug_html
+        if modo is ModoDebugHtml.SEMPRE:
+            return True
+        if modo is ModoDebugHtml.NUNCA:
+            return False
+        if erro:
+            return True
+        return modo is ModoDebugHtml.AMOSTRA and next(self._contador_debug) % _AMOSTRA_DEBUG_HTML == 0
+    
+    def _salvar_html_debug(
+        self,
+        html: str,
+        prefixo: str,
+        numero_processo: str = "",
+        erro: bool = False
+    ) -> Optional[Path]:
         """
-        Salva HTML para análise de debug.
+        Salva HTML para análise de debug, conforme o modo configurado.
         
         Args:
             html: Conteúdo HTML a salvar
             prefixo: Prefixo do arquivo (ex: 'busca_direta', 'api_response')
             numero_processo: Número do processo (opcional)
+            erro: Resposta inesperada (salva nos modos EM_ERRO e AMOSTRA)
         
         Returns:
-            Path do arquivo salvo ou None se debug desabilitado
+            Path do arquivo (gravado em segundo plano) ou None se não salvo
         """
-        if not self.salvar_debug_html:
+        if not self._deve_salvar_html(erro):
             return None
         
         try:
@@ -84,24 +367,213 @@ class ProcessSearchService:
             filename = f"{prefixo}_{numero_safe}_{timestamp}.html"
             filepath = self._debug_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"<!-- DEBUG HTML -->\n")
-                f.write(f"<!-- Prefixo: {prefixo} -->\n")
-                f.write(f"<!-- Processo: {numero_processo} -->\n")
-                f.write(f"<!-- Timestamp: {timestamp} -->\n")
-                f.write(f"<!-- Tamanho: {len(html)} bytes -->\n\n")
-                f.write(html)
+            cabecalho = (
+                f"<!-- DEBUG HTML -->\n"
+                f"<!-- Prefixo: {prefixo} -->\n"
+                f"<!-- Processo: {numero_processo} -->\n"
+                f"<!-- Timestamp: {timestamp} -->\n"
+                f"<!-- Tamanho: {len(html)} bytes -->\n\n"
+            )
             
-            self.logger.info(f"[DEBUG] HTML salvo: {filepath}")
+            # OTIMIZAÇÃO: a escrita em disco sai do caminho da busca
+            self._executor_debug.submit(self._escrever_html_debug, filepath, cabecalho + html)
             return filepath
             
         except Exception as e:
             self.logger.error(f"[DEBUG] Erro ao salvar HTML: {e}")
             return None
     
+    def _escrever_html_debug(self, filepath: Path, conteudo: str):
+        """Grava um HTML de debug (executado na thread de debug)."""
+        try:
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write(conteudo)
+            self.logger.info(f"[DEBUG] HTML salvo: {filepath}")
+        except Exception as e:
+            self.logger.error(f"[DEBUG] Erro ao salvar HTML: {e}")
+    
+    def close(self):
+        """Encerra os executores e o cache persistente."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor_consultas.shutdown(wait=False, cancel_futures=True)
+        # HTMLs de debug já enfileirados ainda são gravados
+        self._executor_debug.shutdown(wait=False)
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+                self._db = None
+    
+    def __enter__(self) -> "ProcessSearchService":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def limpar_cache(self):
-        """Limpa cache de resultados de busca."""
-        self._cache_resultados.clear()
+        """
+        Limpa cache de resultados de busca (em memória e em disco).
+        
+        Inclui as listagens do painel, o índice e as dicas de etiquetas.
+        """
+        with self._cache_lock:
+            self._cache_resultados.clear()
+            self._cache_chaves.clear()
+            self._cache_painel.clear()
+            self._indice_etiquetas.clear()
+            self._dicas_etiqueta.clear()
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    self._db.execute("DELETE FROM busca_id")
+                    self._db.commit()
+            except sqlite3.Error as e:
+                self.logger.debug("[CACHE] Falha ao limpar cache: %s", e)
+    
+    def _ler_cache_memoria(self, numero: str) -> Optional[ResultadoBusca]:
+        """Consulta o cache LRU em memória, renovando a entrada encontrada."""
+        with self._cache_lock:
+            cached = self._cache_resultados.get(numero)
+            if cached is not None:
+                self._cache_resultados.move_to_end(numero)
+            return cached
+    
+    def _gravar_cache_memoria(self, numero: str, resultado: ResultadoBusca):
+        """Guarda no cache LRU, descartando o resultado menos usado se cheio."""
+        with self._cache_lock:
+            self._cache_resultados[numero] = resultado
+            self._cache_resultados.move_to_end(numero)
+            if len(self._cache_resultados) > _MAX_CACHE_RESULTADOS:
+                self._cache_resultados.popitem(last=False)
+    
+    def _abrir_cache_persistente(self, path: Path):
+        """Abre (ou cria) o cache SQLite; falhas apenas desativam o cache."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            # Tabela antiga guardava a chave de acesso; descartada
+            db.execute("DROP TABLE IF EXISTS busca")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS busca_id ("
+                "escopo TEXT, numero TEXT, id_processo INTEGER, metodo TEXT, ts INTEGER, "
+                "PRIMARY KEY (escopo, numero))"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS endpoint_stats ("
+                "endpoint TEXT PRIMARY KEY, hits INTEGER, misses INTEGER, ultimo_erro REAL)"
+            )
+            db.commit()
+            for endpoint, hits, misses, ultimo_erro in db.execute("SELECT * FROM endpoint_stats"):
+                self._stats_endpoints[endpoint] = [hits, misses, ultimo_erro or 0.0]
+            self._db = db
+        except Exception as e:
+            self.logger.debug("[CACHE] Cache persistente indisponível: %s", e)
+            self._db = None
+    
+    def _escopo_cache(self) -> Optional[str]:
+        """Instância do PJE + usuário logado; sem usuário, não há escopo."""
+        usuario = self.client.usuario
+        if usuario is None or not usuario.id_usuario:
+            return None
+        return f"{BASE_URL}|{usuario.id_usuario}"
+    
+    def _ler_cache_persistente(self, numero: str) -> Optional[ResultadoBusca]:
+        """
+        Retorna o idProcesso salvo em disco (dentro do TTL), com chave de
+        acesso recém-gerada; sem chave válida, o acerto é ignorado.
+        """
+        escopo = self._escopo_cache()
+        if self._db is None or escopo is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT id_processo, metodo, ts FROM busca_id WHERE escopo = ? AND numero = ?",
+                    (escopo, numero)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        
+        if not row or time.time() - row[2] > CACHE_BUSCA_TTL:
+            return None
+        
+        chave = self.gerar_chave_acesso(row[0])
+        if not chave:
+            return None
+        
+        return ResultadoBusca(
+            encontrado=True,
+            id_processo=row[0],
+            numero_processo=numero,
+            chave_acesso=chave,
+            metodo_busca=row[1] or ""
+        )
+    
+    def _gravar_cache_persistente(self, resultado: ResultadoBusca):
+        """Persiste o idProcesso de um resultado encontrado (sem a chave)."""
+        escopo = self._escopo_cache()
+        if self._db is None or escopo is None or not resultado.encontrado:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO busca_id VALUES (?, ?, ?, ?, ?)",
+                    (
+                        escopo,
+                        resultado.numero_processo,
+                        resultado.id_processo,
+                        resultado.metodo_busca,
+                        int(time.time())
+                    )
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            self.logger.debug("[CACHE] Falha ao gravar cache: %s", e)
+    
+    def _ordenar_endpoints(
+        self,
+        endpoints: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        numero_processo: str
+    ) -> List[Tuple[str, str, Optional[Dict[str, Any]]]]:
+        """
+        Ordena os endpoints pela taxa de acerto histórica e descarta os que
+        falharam recentemente sem nunca terem acertado.
+        """
+        agora = time.time()
+        pontuados = []
+        with self._stats_lock:
+            for posicao, item in enumerate(endpoints):
+                stats = self._stats_endpoints.get(item[1].replace(numero_processo, "{numero}"))
+                if not stats:
+                    pontuados.append((0.0, posicao, item))
+                    continue
+                hits, misses, ultimo_erro = stats
+                if not hits and agora - ultimo_erro < ENDPOINT_NEGATIVO_TTL:
+                    continue
+                pontuados.append((-hits / (hits + misses + 1), posicao, item))
+        pontuados.sort()
+        return [item for _, _, item in pontuados]
+    
+    def _registrar_endpoint(self, chave: str, acerto: bool, erro_http: bool = False):
+        """Atualiza (e persiste) as estatísticas de um endpoint da API."""
+        with self._stats_lock:
+            stats = self._stats_endpoints.setdefault(chave, [0, 0, 0.0])
+            if acerto:
+                stats[0] += 1
+            else:
+                stats[1] += 1
+                if erro_http:
+                    stats[2] = time.time()
+            linha = (chave, stats[0], stats[1], stats[2])
+        
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute("INSERT OR REPLACE INTO endpoint_stats VALUES (?, ?, ?, ?)", linha)
+                self._db.commit()
+        except sqlite3.Error as e:
+            self.logger.debug("[CACHE] Falha ao gravar estatísticas: %s", e)
     
     def buscar_processo(
         self, 
@@ -120,13 +592,20 @@ class ProcessSearchService:
             self.logger.error(f"[BUSCA] ❌ Número de processo inválido: {numero_processo}")
             return ResultadoBusca(numero_processo=numero_processo)
         
-        self.logger.debug(f"[BUSCA] Número normalizado: {numero_normalizado}")
+        self.logger.debug("[BUSCA] Número normalizado: %s", numero_normalizado)
         
         # Verificar cache
-        if usar_cache and numero_normalizado in self._cache_resultados:
-            cached = self._cache_resultados[numero_normalizado]
-            self.logger.info(f"[BUSCA] ✓ Cache hit (ID={cached.id_processo})")
-            return cached
+        if usar_cache:
+            cached = self._ler_cache_memoria(numero_normalizado)
+            if cached is not None:
+                self.logger.info(f"[BUSCA] ✓ Cache hit (ID={cached.id_processo})")
+                return cached
+            
+            cached = self._ler_cache_persistente(numero_normalizado)
+            if cached:
+                self.logger.info(f"[BUSCA] ✓ Cache persistente (ID={cached.id_processo})")
+                self._gravar_cache_memoria(numero_normalizado, cached)
+                return cached
         
         # Definir métodos de busca
         # MUDANÇA: api_processo primeiro por ser mais confiável
@@ -136,67 +615,196 @@ class ProcessSearchService:
         
         self.logger.info(f"[BUSCA] Métodos a utilizar: {metodos}")
         
-        resultado = ResultadoBusca(numero_processo=numero_normalizado)
+        # OTIMIZAÇÃO: single-flight; buscas simultâneas do mesmo número
+        # aguardam a que já está em andamento em vez de repetir o fan-out
+        chave = (numero_normalizado, tuple(metodos))
+        with self._buscas_lock:
+            futuro = self._buscas_em_andamento.get(chave)
+            responsavel = futuro is None
+            if responsavel:
+                futuro = Future()
+                self._buscas_em_andamento[chave] = futuro
         
-        for i, metodo in enumerate(metodos, 1):
-            self.logger.info(f"[BUSCA] [{i}/{len(metodos)}] ===== Método: {metodo} =====")
-            
+        if not responsavel:
+            self.logger.info(f"[BUSCA] Aguardando busca já em andamento de {numero_normalizado}")
+            # A busca em andamento tem teto próprio; se passar dele (pool ou
+            # socket travado), quem só aguardava não trava junto
             try:
-                if metodo == 'api_processo':
-                    resultado = self._buscar_via_api_processo(numero_normalizado)
-                elif metodo == 'busca_direta':
-                    resultado = self._buscar_via_consulta_direta(numero_normalizado)
-                elif metodo == 'consulta_publica':
-                    resultado = self._buscar_via_consulta_publica(numero_normalizado)
-                elif metodo == 'painel_tarefas':
-                    resultado = self._buscar_via_painel_tarefas(numero_normalizado)
-                elif metodo == 'etiquetas':
-                    resultado = self._buscar_via_etiquetas(numero_normalizado)
-                else:
-                    self.logger.warning(f"[BUSCA] ⚠️ Método desconhecido: {metodo}")
+                return futuro.result(timeout=TIMEOUT_MAXIMO_BUSCA + self.timeout_por_metodo)
+            except FutureTimeoutError:
+                self.logger.warning(
+                    f"[BUSCA] ⏱️ Busca em andamento de {numero_normalizado} não respondeu a tempo"
+                )
+                return ResultadoBusca(numero_processo=numero_normalizado, inconclusivo=True)
+        
+        try:
+            resultado = self._executar_busca(numero_normalizado, metodos, usar_cache)
+        except BaseException as e:
+            futuro.set_exception(e)
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            with self._buscas_lock:
+                self._buscas_em_andamento.pop(chave, None)
+    
+    def _rodar_metodo(self, funcao, numero: str, progresso: _ProgressoMetodo) -> ResultadoBusca:
+        """Executa um método de busca, iniciando o relógio dele."""
+        progresso.inicio = time.monotonic()
+        progresso.atividade = progresso.inicio
+        self._progresso_local.atual = progresso
+        try:
+            return funcao(numero)
+        finally:
+            self._progresso_local.atual = None
+    
+    def _marcar_progresso(self):
+        """Renova o relógio do método de busca da thread atual, se houver."""
+        progresso = getattr(self._progresso_local, "atual", None)
+        if progresso is not None:
+            progresso.marcar()
+    
+    def _submeter_consulta(self, funcao, *args, **kwargs) -> Future:
+        """
+        Envia uma consulta ao pool de consultas.
+        
+        A conclusão da consulta conta como progresso do método que a pediu.
+        """
+        progresso = getattr(self._progresso_local, "atual", None)
+        if progresso is None:
+            return self._executor_consultas.submit(funcao, *args, **kwargs)
+        
+        def executar():
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                progresso.marcar()
+        
+        return self._executor_consultas.submit(executar)
+    
+    def _executar_busca(
+        self,
+        numero_normalizado: str,
+        metodos: List[str],
+        usar_cache: bool
+    ) -> ResultadoBusca:
+        """Executa as estratégias de busca e atualiza os caches."""
+        resultado = ResultadoBusca(numero_processo=numero_normalizado)
+        
+        estrategias = {
+            'api_processo': self._buscar_via_api_processo,
+            'busca_direta': self._buscar_via_consulta_direta,
+            'consulta_publica': self._buscar_via_consulta_publica,
+            'painel_tarefas': self._buscar_via_painel_tarefas,
+            'etiquetas': self._buscar_via_etiquetas,
+        }
+        
+        # OTIMIZAÇÃO: métodos rodam em paralelo; o primeiro que encontrar
+        # vence e os demais são descartados (latência = mais rápido, não soma)
+        futures = {}
+        progressos: Dict[Future, _ProgressoMetodo] = {}
+        for metodo in metodos:
+            funcao = estrategias.get(metodo)
+            if funcao is None:
+                self.logger.warning(f"[BUSCA] ⚠️ Método desconhecido: {metodo}")
+                continue
+            # consulta_publica executa a mesma busca direta; disparar as duas
+            # só duplicaria as requisições
+            if metodo == 'consulta_publica' and 'busca_direta' in metodos:
+                self.logger.debug("[BUSCA] consulta_publica coberta por busca_direta")
+                continue
+            progresso = _ProgressoMetodo()
+            future = self._executor.submit(self._rodar_metodo, funcao, numero_normalizado, progresso)
+            futures[future] = metodo
+            progressos[future] = progresso
+        prioridade = {metodo: i for i, metodo in enumerate(metodos)}
+        
+        # OTIMIZAÇÃO: um método parado não segura a resposta dos demais.
+        # O prazo de cada um conta a partir do início da execução dele e é
+        # renovado enquanto ele progride; métodos ainda na fila esperam
+        # (até o teto da busca inteira)
+        pendentes = set(futures)
+        esgotados: List[Future] = []
+        limite_busca = time.monotonic() + TIMEOUT_MAXIMO_BUSCA
+        while pendentes and not resultado.encontrado:
+            agora = time.monotonic()
+            for future in [
+                f for f in pendentes
+                if progressos[f].inicio is not None
+                and agora - progressos[f].atividade >= self.timeout_por_metodo
+            ]:
+                pendentes.discard(future)
+                esgotados.append(future)
+            if not pendentes or agora >= limite_busca:
+                break
+            
+            proximo_prazo = min(
+                (
+                    progressos[f].atividade + self.timeout_por_metodo
+                    for f in pendentes if progressos[f].inicio is not None
+                ),
+                default=agora + self.timeout_por_metodo
+            )
+            concluidos, pendentes = wait(
+                pendentes,
+                timeout=max(min(proximo_prazo, limite_busca) - agora, 0),
+                return_when=FIRST_COMPLETED
+            )
+            # Concluídos juntos: vale a ordem de prioridade de `metodos`
+            for future in sorted(concluidos, key=lambda f: prioridade[futures[f]]):
+                metodo = futures[future]
+                try:
+                    resultado_metodo = future.result()
+                except Exception as e:
+                    self.logger.error(f"[BUSCA] ❌ Erro no método {metodo}: {type(e).__name__}: {str(e)}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("[BUSCA] Traceback:\n%s", traceback.format_exc())
                     continue
                 
-                if resultado.encontrado:
+                if resultado_metodo.encontrado:
+                    resultado = resultado_metodo
                     self.logger.info(f"[BUSCA] ✅ SUCESSO via {metodo}!")
                     self.logger.info(f"[BUSCA]    ID={resultado.id_processo}")
                     self.logger.info(f"[BUSCA]    CA={resultado.chave_acesso[:30] + '...' if resultado.chave_acesso else 'N/A'}")
                     break
                 else:
                     self.logger.info(f"[BUSCA] ❌ Não encontrado via {metodo}")
-                    
-            except Exception as e:
-                self.logger.error(f"[BUSCA] ❌ Erro no método {metodo}: {type(e).__name__}: {str(e)}")
-                import traceback
-                self.logger.debug(f"[BUSCA] Traceback:\n{traceback.format_exc()}")
         
-        # Salvar no cache
-        if usar_cache:
-            self._cache_resultados[numero_normalizado] = resultado
+        for future in chain(pendentes, esgotados):
+            future.cancel()
         
         if not resultado.encontrado:
+            esgotados.extend(pendentes)
+            for future in esgotados:
+                self.logger.warning(
+                    f"[BUSCA] ⏱️ Tempo esgotado ({self.timeout_por_metodo:.0f}s sem progresso) "
+                    f"no método {futures[future]}"
+                )
+            resultado.inconclusivo = bool(esgotados)
+        
+        # Salvar no cache (timeout sem resultado não é cacheado)
+        if usar_cache and not resultado.inconclusivo:
+            self._gravar_cache_memoria(numero_normalizado, resultado)
+            self._gravar_cache_persistente(resultado)
+        
+        if resultado.inconclusivo:
+            self.logger.warning(f"[BUSCA] ⚠️ Busca INCONCLUSIVA: tempo esgotado sem resultado")
+        elif not resultado.encontrado:
             self.logger.warning(f"[BUSCA] ⚠️ PROCESSO NÃO ENCONTRADO após todos os métodos")
         
         self.logger.info(f"[BUSCA] ========== FIM DA BUSCA ==========")
         return resultado
     
-    def _normalizar_numero(self, numero: str) -> Optional[str]:
+    @staticmethod
+    def _normalizar_numero(numero: str) -> Optional[str]:
         """Normaliza número do processo para formato CNJ."""
-        numero = numero.strip()
-        
-        if re.match(r'^\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}$', numero):
-            return numero
-        
-        apenas_numeros = re.sub(r'[^\d]', '', numero)
-        
-        if len(apenas_numeros) != 20:
-            self.logger.debug(f"[NORMALIZAR] Esperado 20 dígitos, encontrado {len(apenas_numeros)}")
-            return None
-        
-        return (
-            f"{apenas_numeros[:7]}-{apenas_numeros[7:9]}."
-            f"{apenas_numeros[9:13]}.{apenas_numeros[13]}."
-            f"{apenas_numeros[14:16]}.{apenas_numeros[16:20]}"
-        )
+        # OTIMIZAÇÃO: o parse é memoizado; o log fica fora do cache para
+        # aparecer a cada entrada inválida, não só na primeira
+        formatado, digitos = _formatar_cnj(numero)
+        if formatado is None:
+            get_logger().debug("[NORMALIZAR] Esperado 20 dígitos, encontrado %s", digitos)
+        return formatado
     
     def _buscar_via_api_processo(self, numero_processo: str) -> ResultadoBusca:
         """
@@ -238,60 +846,128 @@ class ProcessSearchService:
             ("POST", "api/processo/buscar", {"numeroProcesso": numero_processo}),
         ]
         
+        # OTIMIZAÇÃO: endpoints que costumam acertar vão primeiro; os que
+        # deram 404/403 recentemente (e nunca acertaram) são pulados
+        endpoints_para_tentar = self._ordenar_endpoints(endpoints_para_tentar, numero_processo)
+        self.logger.debug("[API_PROCESSO] %s endpoints a sondar", len(endpoints_para_tentar))
+        
         try:
-            for i, (metodo, endpoint, dados) in enumerate(endpoints_para_tentar, 1):
-                self.logger.debug(f"[API_PROCESSO] [{i}/{len(endpoints_para_tentar)}] Tentando: {metodo} {endpoint}")
-                
-                try:
-                    if metodo == "GET":
-                        resp = self.client.api_get(endpoint)
-                    else:  # POST
-                        resp = self.client.api_post(endpoint, dados)
-                    
-                    self.logger.debug(f"[API_PROCESSO]   Response: HTTP {resp.status_code}")
-                    
-                    # Salvar resposta para debug
-                    self._salvar_html_debug(
-                        resp.text, 
-                        f"api_{endpoint.replace('/', '_')[:50]}", 
-                        numero_processo
-                    )
+            # OTIMIZAÇÃO: todos os endpoints em voo ao mesmo tempo no pool de
+            # consultas; o primeiro que devolver o idProcesso encerra a busca
+            futures = {
+                self._submeter_consulta(
+                    self._sondar_endpoint_api, metodo, endpoint, dados, numero_processo
+                ): endpoint
+                for metodo, endpoint, dados in endpoints_para_tentar
+            }
+            try:
+                for future in as_completed(futures):
+                    endpoint = futures[future]
+                    try:
+                        id_processo = future.result()
+                    except Exception as e:
+                        self.logger.debug("[API_PROCESSO]   Erro em %s: %s: %s", endpoint, type(e).__name__, str(e)[:50])
+                        continue
                     
-                    if resp.status_code == 200:
-                        # Tentar extrair idProcesso da resposta
-                        id_processo = self._extrair_id_processo_de_resposta(resp.text, numero_processo)
+                    if id_processo:
+                        resultado.encontrado = True
+                        resultado.id_processo = id_processo
+                        resultado.metodo_busca = f"api_{endpoint.split('/')[0]}"
                         
-                        if id_processo:
-                            resultado.encontrado = True
-                            resultado.id_processo = id_processo
-                            resultado.metodo_busca = f"api_{endpoint.split('/')[0]}"
-                            
-                            # Gerar chave de acesso
-                            resultado.chave_acesso = self.gerar_chave_acesso(id_processo) or ""
-                            
-                            self.logger.info(f"[API_PROCESSO] ✅ Encontrado via {endpoint}!")
-                            self.logger.info(f"[API_PROCESSO]   idProcesso: {id_processo}")
-                            return resultado
-                    
-                    elif resp.status_code == 404:
-                        self.logger.debug(f"[API_PROCESSO]   Endpoint não existe ou processo não encontrado")
-                    
-                    elif resp.status_code == 403:
-                        self.logger.debug(f"[API_PROCESSO]   Sem permissão para este endpoint")
-                    
-                except Exception as e:
-                    self.logger.debug(f"[API_PROCESSO]   Erro: {type(e).__name__}: {str(e)[:50]}")
-                    continue
+                        # Gerar chave de acesso
+                        resultado.chave_acesso = self.gerar_chave_acesso(id_processo) or ""
+                        
+                        self.logger.info(f"[API_PROCESSO] ✅ Encontrado via {endpoint}!")
+                        self.logger.info(f"[API_PROCESSO]   idProcesso: {id_processo}")
+                        return resultado
+            finally:
+                for future in futures:
+                    future.cancel()
             
             self.logger.info("[API_PROCESSO] ❌ Não encontrado em nenhum endpoint de API")
             return resultado
             
         except Exception as e:
             self.logger.error(f"[API_PROCESSO] ❌ EXCEÇÃO: {type(e).__name__}: {str(e)}")
-            import traceback
-            self.logger.debug(f"[API_PROCESSO] Traceback:\n{traceback.format_exc()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("[API_PROCESSO] Traceback:\n%s", traceback.format_exc())
             return resultado
     
+    def _sondar_endpoint_api(
+        self,
+        metodo: str,
+        endpoint: str,
+        dados: Optional[Dict[str, Any]],
+        numero_processo: str
+    ) -> Optional[int]:
+        """Consulta um endpoint da API e retorna o idProcesso, se houver."""
+        self.logger.debug("[API_PROCESSO] Tentando: %s %s", metodo, endpoint)
+        
+        # OTIMIZAÇÃO: corpo lido em streaming; páginas grandes não-JSON
+        # param de ser baixadas assim que o idProcesso aparece
+        if metodo == "GET":
+            resp = self.client.api_get(endpoint, stream=True)
+        else:  # POST
+            resp = self.client.api_post(endpoint, dados, stream=True)
+        
+        self.logger.debug("[API_PROCESSO]   %s: HTTP %s", endpoint, resp.status_code)
+        
+        if resp.status_code == 200:
+            id_processo, texto = self._extrair_id_de_stream(resp, numero_processo)
+        else:
+            id_processo, texto = None, resp.text
+        
+        # Salvar resposta para debug (404/403 são respostas esperadas)
+        self._salvar_html_debug(
+            texto, 
+            f"api_{endpoint.replace('/', '_')[:50]}", 
+            numero_processo,
+            erro=resp.status_code not in (200, 403, 404)
+        )
+        
+        chave = endpoint.replace(numero_processo, "{numero}")
+        if resp.status_code == 200:
+            self._registrar_endpoint(chave, acerto=bool(id_processo))
+            return id_processo
+        
+        if resp.status_code == 404:
+            self.logger.debug("[API_PROCESSO]   %s: endpoint não existe ou processo não encontrado", endpoint)
+            self._registrar_endpoint(chave, acerto=False, erro_http=True)
+        elif resp.status_code == 403:
+            self.logger.debug("[API_PROCESSO]   %s: sem permissão para este endpoint", endpoint)
+            self._registrar_endpoint(chave, acerto=False, erro_http=True)
+        return None
+    
+    def _extrair_id_de_stream(
+        self,
+        resp: requests.Response,
+        numero_processo: str
+    ) -> Tuple[Optional[int], str]:
+        """
+        Extrai o idProcesso de uma resposta aberta com stream=True.
+        
+        JSON precisa do documento inteiro (validação do numeroProcesso);
+        demais respostas são varridas bloco a bloco até o primeiro id.
+        
+        Returns:
+            Tupla (idProcesso ou None, texto lido)
+        """
+        resp.encoding = resp.encoding or "utf-8"
+        blocos = resp.iter_content(chunk_size=16384, decode_unicode=True)
+        primeiro = next(blocos, "")
+        
+        if primeiro[:64].lstrip()[:1] in ("{", "["):
+            try:
+                texto = primeiro + "".join(blocos)
+            finally:
+                resp.close()
+            return self._extrair_id_processo_de_resposta(texto, numero_processo), texto
+        
+        match, texto = self._ler_ate_padrao(
+            resp, _RE_ID_RESPOSTA, blocos=chain((primeiro,), blocos)
+        )
+        return (int(match.group(match.lastindex)) if match else None), texto
+    
     def _extrair_id_processo_de_resposta(self, texto: str, numero_processo: str) -> Optional[int]:
         """
         Tenta extrair o idProcesso de uma resposta da API.
@@ -301,18 +977,20 @@ class ProcessSearchService:
         - JSON com lista de processos
         - Texto com padrão idProcesso=XXXXX
         """
-        import json
+        # OTIMIZAÇÃO: só tenta o parser JSON se o corpo começa como JSON;
+        # páginas HTML de erro vão direto para a regex
+        inicio = texto[:64].lstrip()[:1]
         
         # Tentar parsear como JSON
         try:
-            data = json.loads(texto)
+            data = json_loads(texto) if inicio in ("{", "[") else None
             
             # Se for dict direto
             if isinstance(data, dict):
                 # Verificar se é o processo correto
                 num_proc = data.get("numeroProcesso", "")
                 if num_proc and num_proc != numero_processo:
-                    self.logger.debug(f"[EXTRAIR_ID] Processo diferente: {num_proc}")
+                    self.logger.debug("[EXTRAIR_ID] Processo diferente: %s", num_proc)
                     return None
                 
                 # Extrair ID
@@ -339,47 +1017,114 @@ class ProcessSearchService:
                             for campo in ["idProcesso", "id", "idProcessoTrf"]:
                                 if campo in item and item[campo]:
                                     return int(item[campo])
-        except json.JSONDecodeError:
+            
+            # OTIMIZAÇÃO: JSON válido já foi percorrido campo a campo;
+            # a regex sobre o texto só serve para respostas não estruturadas
+            if data is not None:
+                return None
+        except ValueError:  # JSONDecodeError (stdlib e orjson) herda de ValueError
             pass
         
-        # Tentar extrair com regex
-        patterns = [
-            rf'"idProcesso"\s*:\s*(\d+)',
-            rf'"id"\s*:\s*(\d+)',
-            rf'idProcesso["\']?\s*[:=]\s*["\']?(\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, texto)
-            if match:
-                return int(match.group(1))
+        # Tentar extrair com regex (pré-filtro por substring evita varrer
+        # páginas que não têm nenhum dos literais)
+        if "idProcesso" not in texto and '"id"' not in texto:
+            return None
+        match = _RE_ID_RESPOSTA.search(texto)
+        if match:
+            return int(match.group(match.lastindex))
         
         return None
 
-    def _extrair_partes_numero(self, numero: str) -> Optional[Dict[str, str]]:
-        """Extrai partes do número CNJ para campos do formulário."""
-        match = re.match(
-            r'^(\d{7})-(\d{2})\.(\d{4})\.(\d)\.(\d{2})\.(\d{4})$', 
-            numero
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extrair_partes_numero(numero: str) -> Optional[Tuple[str, str, str, str, str, str]]:
+        """
+        Extrai partes do número CNJ para campos do formulário (memoizado).
+        
+        Returns:
+            Tupla imutável (sequencial, digito, ano, segmento, tribunal, origem)
+        """
+        return parse_cnj(numero)
+
+    def _obter_formulario_consulta(
+        self,
+        url_consulta: str,
+        numero_processo: str,
+        usar_cache: bool = True
+    ) -> Optional[Tuple[str, str, bool]]:
+        """
+        Retorna (viewstate, id do botão de pesquisa, veio_do_cache).
+        
+        OTIMIZAÇÃO: reaproveita o último ViewState por VIEWSTATE_TTL,
+        evitando o GET da página de consulta a cada busca.
+        """
+        viewstate, button_id, ts = getattr(self._viewstate_local, "cache", ("", "", 0.0))
+        if usar_cache and viewstate and time.time() - ts < VIEWSTATE_TTL:
+            self.logger.debug("[BUSCA_DIRETA] [1/4] ViewState em cache (%.0fs)", time.time() - ts)
+            return viewstate, button_id, True
+        
+        self.logger.info(f"[BUSCA_DIRETA] [1/4] Acessando página de consulta...")
+        
+        resp = self.client.session.get(
+            url_consulta,
+            params={"iframe": "true"},
+            timeout=self.client.timeout
+        )
+        
+        self._marcar_progresso()
+        self.logger.info(f"[BUSCA_DIRETA] Response: HTTP {resp.status_code} ({len(resp.content)} bytes)")
+        
+        # OTIMIZAÇÃO: Response.text decodifica o corpo a cada acesso;
+        # decodifica uma vez só
+        html = resp.text
+        
+        # Salvar HTML da página inicial para debug
+        self._salvar_html_debug(
+            html, "busca_direta_pagina_inicial", numero_processo,
+            erro=resp.status_code != 200
         )
         
-        if not match:
-            self.logger.debug(f"[PARTES] Não extraiu partes de: {numero}")
+        if resp.status_code != 200:
+            self.logger.error(f"[BUSCA_DIRETA] ❌ Erro HTTP {resp.status_code}")
             return None
         
-        partes = {
-            "sequencial": match.group(1),
-            "digito": match.group(2),
-            "ano": match.group(3),
-            "segmento": match.group(4),
-            "tribunal": match.group(5),
-            "origem": match.group(6)
-        }
+        viewstate = extrair_viewstate(html)
+        if not viewstate:
+            self.logger.error("[BUSCA_DIRETA] ❌ ViewState não encontrado!")
+            return None
         
-        self.logger.debug(f"[PARTES] seq={partes['sequencial']} dig={partes['digito']} ano={partes['ano']} seg={partes['segmento']} trib={partes['tribunal']} orig={partes['origem']}")
+        self.logger.debug("[BUSCA_DIRETA] ViewState OK: %s...", viewstate[:50])
         
-        return partes
-
+        # Encontrar o ID correto do botão de pesquisa analisando o HTML
+        # (OTIMIZAÇÃO: reaproveitado entre renovações do ViewState)
+        button_id = self._botao_pesquisa
+        if not button_id:
+            button_id = self._encontrar_botao_pesquisa(html)
+            if button_id != _BOTAO_PESQUISA_PADRAO:
+                self._botao_pesquisa = button_id
+        self.logger.debug("[BUSCA_DIRETA] Botão de pesquisa: %s", button_id)
+        
+        self._viewstate_local.cache = (viewstate, button_id, time.time())
+        return viewstate, button_id, False
+    
+    def _descartar_viewstate(self) -> None:
+        """Descarta o ViewState em cache da thread atual."""
+        self._viewstate_local.cache = ("", "", 0.0)
+    
+    @staticmethod
+    def _linha_contem_numero(html: str, match: "re.Match[str]", numero_cnj: str) -> bool:
+        """
+        Verifica se a linha (<tr>) que contém o match traz o número CNJ pedido.
+        
+        Compara só os dígitos do texto da linha (sem tags e entidades), então
+        o número pode vir com outra formatação ou quebrado em várias tags.
+        """
+        inicio = html.rfind("<tr", 0, match.start())
+        fim = html.find("</tr>", match.end())
+        linha = html[max(inicio, 0):fim if fim >= 0 else len(html)]
+        texto = unescape(_RE_TAGS.sub("", linha))
+        return numero_cnj.translate(TABELA_SO_DIGITOS) in texto.translate(TABELA_SO_DIGITOS)
+    
     def _buscar_via_consulta_direta(self, numero_processo: str) -> ResultadoBusca:
         """
         Busca processo via endpoint de consulta direta.
@@ -398,86 +1143,70 @@ class ProcessSearchService:
                 self.logger.error(f"[BUSCA_DIRETA] ❌ Falha ao extrair partes do número")
                 return resultado
             
-            # 1. Acessar página de consulta pública
-            url_consulta = f"{BASE_URL}/pje/Processo/ConsultaProcesso/listView.seam"
-            self.logger.info(f"[BUSCA_DIRETA] [1/4] Acessando página de consulta...")
-            
-            resp = self.client.session.get(
-                url_consulta,
-                params={"iframe": "true"},
-                timeout=self.client.timeout
-            )
-            
-            self.logger.info(f"[BUSCA_DIRETA] Response: HTTP {resp.status_code} ({len(resp.text)} bytes)")
-            
-            # Salvar HTML da página inicial para debug
-            self._salvar_html_debug(resp.text, "busca_direta_pagina_inicial", numero_processo)
-            
-            if resp.status_code != 200:
-                self.logger.error(f"[BUSCA_DIRETA] ❌ Erro HTTP {resp.status_code}")
-                return resultado
-            
-            viewstate = extrair_viewstate(resp.text)
-            if not viewstate:
-                self.logger.error("[BUSCA_DIRETA] ❌ ViewState não encontrado!")
-                return resultado
-            
-            self.logger.debug(f"[BUSCA_DIRETA] ViewState OK: {viewstate[:50]}...")
-            
-            delay(0.5, 1.0)
+            sequencial, digito, ano, segmento, tribunal, origem = partes
+            numero_cnj = f"{sequencial}-{digito}.{ano}.{segmento}.{tribunal}.{origem}"
+            self.logger.debug("[PARTES] seq=%s dig=%s ano=%s seg=%s trib=%s orig=%s", sequencial, digito, ano, segmento, tribunal, origem)
             
+            # 1. Obter ViewState (reaproveitado enquanto a sessão JSF vale)
             # 2. Fazer a busca preenchendo os campos do formulário
-            self.logger.info(f"[BUSCA_DIRETA] [2/4] Enviando formulário de busca...")
-            
-            # Encontrar o ID correto do botão de pesquisa analisando o HTML
-            button_id = self._encontrar_botao_pesquisa(resp.text)
-            self.logger.debug(f"[BUSCA_DIRETA] Botão de pesquisa: {button_id}")
-            
-            form_data = {
-                "AJAXREQUEST": "_viewRoot",
-                "fPP": "fPP",
-                "fPP:numeroProcesso:numeroSequencial": partes["sequencial"],
-                "fPP:numeroProcesso:numeroDigitoVerificador": partes["digito"],
-                "fPP:numeroProcesso:Ano": partes["ano"],
-                "fPP:numeroProcesso:ramoJustica": partes["segmento"],
-                "fPP:numeroProcesso:respectivoTribunal": partes["tribunal"],
-                "fPP:numeroProcesso:NumeroOrgaoJustica": partes["origem"],
-                "fPP:j_id150:nomeParte": "",
-                "fPP:decorationDados:ufOABCombo": "org.jboss.seam.ui.NoSelectionConverter.noSelectionValue",
-                "fPP:jurisdicaoComboDecoration:jurisdicaoCombo": "org.jboss.seam.ui.NoSelectionConverter.noSelectionValue",
-                "fPP:orgaoJulgadorComboDecoration:orgaoJulgadorCombo": "org.jboss.seam.ui.NoSelectionConverter.noSelectionValue",
-                "fPP:processoReferenciaDecoration:habilitarMascaraProcessoReferencia": "true",
-                "fPP:dataAutuacaoDecoration:dataAutuacaoInicioInputCurrentDate": "",
-                "fPP:dataAutuacaoDecoration:dataAutuacaoFimInputCurrentDate": "",
-                "tipoMascaraDocumento": "on",
-                button_id: button_id,
-                "javax.faces.ViewState": viewstate,
-                "AJAX:EVENTS_COUNT": "1"
-            }
-            
-            resp_busca = self.client.session.post(
-                url_consulta,
-                data=form_data,
-                timeout=self.client.timeout,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "X-Requested-With": "XMLHttpRequest",
-                    "Origin": BASE_URL,
-                    "Referer": f"{BASE_URL}/pje/Processo/ConsultaProcesso/listView.seam?iframe=true"
+            url_consulta = f"{BASE_URL}/pje/Processo/ConsultaProcesso/listView.seam"
+            for tentativa in range(2):
+                formulario = self._obter_formulario_consulta(
+                    url_consulta, numero_processo, usar_cache=(tentativa == 0)
+                )
+                if not formulario:
+                    return resultado
+                viewstate, button_id, em_cache = formulario
+                
+                self.logger.info(f"[BUSCA_DIRETA] [2/4] Enviando formulário de busca...")
+                
+                form_data = {
+                    **_FORMULARIO_CONSULTA,
+                    "fPP:numeroProcesso:numeroSequencial": sequencial,
+                    "fPP:numeroProcesso:numeroDigitoVerificador": digito,
+                    "fPP:numeroProcesso:Ano": ano,
+                    "fPP:numeroProcesso:ramoJustica": segmento,
+                    "fPP:numeroProcesso:respectivoTribunal": tribunal,
+                    "fPP:numeroProcesso:NumeroOrgaoJustica": origem,
+                    button_id: button_id,
+                    "javax.faces.ViewState": viewstate,
                 }
-            )
+                
+                resp_busca = self.client.session.post(
+                    url_consulta,
+                    data=form_data,
+                    timeout=self.client.timeout,
+                    headers=_HEADERS_AJAX_CONSULTA
+                )
+                self._marcar_progresso()
+                
+                # ViewState expirado ou página de erro: invalida e, se veio
+                # do cache, refaz com um novo GET
+                if resp_busca.status_code != 200 or b"ViewExpired" in resp_busca.content:
+                    self._descartar_viewstate()
+                    if em_cache:
+                        self.logger.debug("[BUSCA_DIRETA] ViewState em cache expirou, renovando...")
+                        self._botao_pesquisa = ""
+                        continue
+                break
+            
+            self.logger.info(f"[BUSCA_DIRETA] Response: HTTP {resp_busca.status_code} ({len(resp_busca.content)} bytes)")
             
-            self.logger.info(f"[BUSCA_DIRETA] Response: HTTP {resp_busca.status_code} ({len(resp_busca.text)} bytes)")
+            html = resp_busca.text
             
             # Salvar HTML da resposta da busca para debug
-            self._salvar_html_debug(resp_busca.text, "busca_direta_resposta_busca", numero_processo)
+            self._salvar_html_debug(
+                html, "busca_direta_resposta_busca", numero_processo,
+                erro=resp_busca.status_code != 200
+            )
             
             if resp_busca.status_code != 200:
                 self.logger.error(f"[BUSCA_DIRETA] ❌ Erro HTTP {resp_busca.status_code}")
+                if resp_busca.status_code >= 500:
+                    # Formulário pode ter mudado: redescobrir o botão
+                    self._botao_pesquisa = ""
                 return resultado
             
-            html = resp_busca.text
-            
             # 3. Analisar resposta - procurar linha na tabela
             self.logger.info(f"[BUSCA_DIRETA] [3/4] Analisando resposta...")
             
@@ -486,38 +1215,57 @@ class ProcessSearchService:
                 self.logger.info("[BUSCA_DIRETA] ❌ Processo não encontrado na consulta")
                 return resultado
             
+            # OTIMIZAÇÃO: se a resposta da busca já traz o link dos autos
+            # (idProcesso + ca), o POST de clique é dispensável
+            link_match = _RE_LINK_AUTOS.search(html) if "listAutosDigitais" in html else None
+            if link_match and not self._linha_contem_numero(html, link_match, numero_cnj):
+                self.logger.warning("[BUSCA_DIRETA] ❌ Resultado não corresponde a %s", numero_cnj)
+                self._descartar_viewstate()
+                return resultado
+            if link_match:
+                resultado.encontrado = True
+                resultado.id_processo = int(link_match.group(1))
+                resultado.chave_acesso = link_match.group(2)
+                resultado.metodo_busca = "busca_direta"
+                self.logger.info(f"[BUSCA_DIRETA] ✅ Encontrado na própria resposta da busca!")
+                self.logger.info(f"[BUSCA_DIRETA]   ID: {resultado.id_processo}")
+                return resultado
+            
             # Procurar por linha de resultado na tabela (tbody > tr)
             # O padrão é: fPP:processosTable:0:j_id467 (onde 0 é o índice da linha)
-            row_pattern = r'fPP:processosTable:(\d+):j_id(\d+)'
-            row_matches = re.findall(row_pattern, html)
+            # OTIMIZAÇÃO: só a primeira linha interessa; search para nela
+            row_match = _RE_LINHA_TABELA.search(html) if "processosTable" in html else None
             
-            self.logger.debug(f"[BUSCA_DIRETA] Linhas encontradas na tabela: {len(row_matches)}")
-            
-            if not row_matches:
+            if not row_match:
                 self.logger.debug("[BUSCA_DIRETA] Análise do HTML:")
-                self.logger.debug(f"[BUSCA_DIRETA]   Contém 'processosTable': {'processosTable' in html}")
-                self.logger.debug(f"[BUSCA_DIRETA]   Contém 'rich-table-row': {'rich-table-row' in html}")
-                self.logger.debug(f"[BUSCA_DIRETA]   Contém 'tbody': {'tbody' in html}")
+                self.logger.debug("[BUSCA_DIRETA]   Contém 'processosTable': %s", 'processosTable' in html)
+                self.logger.debug("[BUSCA_DIRETA]   Contém 'rich-table-row': %s", 'rich-table-row' in html)
+                self.logger.debug("[BUSCA_DIRETA]   Contém 'tbody': %s", 'tbody' in html)
                 
                 # Procurar por outras estruturas
                 if 'rich-table-row' in html:
                     self.logger.debug("[BUSCA_DIRETA] Há linhas mas sem o padrão esperado")
                 
+                # Resposta fora do padrão (página de erro): não reaproveitar a view
+                self._descartar_viewstate()
+                return resultado
+            
+            if not self._linha_contem_numero(html, row_match, numero_cnj):
+                self.logger.warning("[BUSCA_DIRETA] ❌ Linha da tabela não corresponde a %s", numero_cnj)
+                self._descartar_viewstate()
                 return resultado
             
             # Pegar a primeira linha (índice 0)
-            row_index = row_matches[0][0]
-            row_j_id = row_matches[0][1]
+            row_index, row_j_id = row_match.groups()
             
-            self.logger.debug(f"[BUSCA_DIRETA] Primeira linha: índice={row_index}, j_id={row_j_id}")
+            self.logger.debug("[BUSCA_DIRETA] Primeira linha: índice=%s, j_id=%s", row_index, row_j_id)
             
             # Atualizar viewstate se houver um novo
             new_viewstate = extrair_viewstate(html)
             if new_viewstate:
                 viewstate = new_viewstate
             
-            delay(0.3, 0.6)
-            
+            # Sem pausa artificial: o clique reutiliza a conexão keep-alive
             # 4. Clicar no processo para obter idProcesso e ca
             self.logger.info(f"[BUSCA_DIRETA] [4/4] Clicando no resultado para obter idProcesso e ca...")
             
@@ -525,37 +1273,37 @@ class ProcessSearchService:
             click_element = f"fPP:processosTable:{row_index}:j_id{row_j_id}"
             
             click_data = {
-                "AJAXREQUEST": "_viewRoot",
-                "fPP": "fPP",
+                **_FORMULARIO_CLIQUE,
                 click_element: click_element,
                 "javax.faces.ViewState": viewstate,
-                "AJAX:EVENTS_COUNT": "1"
             }
             
             resp_click = self.client.session.post(
                 url_consulta,
                 data=click_data,
                 timeout=self.client.timeout,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "X-Requested-With": "XMLHttpRequest",
-                    "Origin": BASE_URL,
-                    "Referer": f"{BASE_URL}/pje/Processo/ConsultaProcesso/listView.seam?iframe=true"
-                }
+                stream=True,
+                headers=_HEADERS_AJAX_CONSULTA
             )
             
-            self.logger.info(f"[BUSCA_DIRETA] Click Response: HTTP {resp_click.status_code} ({len(resp_click.text)} bytes)")
+            self.logger.info(f"[BUSCA_DIRETA] Click Response: HTTP {resp_click.status_code}")
             
-            # Salvar HTML da resposta do click para debug
-            self._salvar_html_debug(resp_click.text, "busca_direta_resposta_click", numero_processo)
+            if self.modo_debug_html is ModoDebugHtml.SEMPRE:
+                # Salvar HTML da resposta do click para debug (corpo completo)
+                click_html = resp_click.text
+                self._salvar_html_debug(click_html, "busca_direta_resposta_click", numero_processo)
+                link_match = _RE_LINK_AUTOS.search(click_html) if "listAutosDigitais" in click_html else None
+            else:
+                # OTIMIZAÇÃO: lê o corpo em blocos e para no primeiro link;
+                # sem link, o corpo foi lido inteiro e vale guardar
+                link_match, click_html = self._ler_ate_padrao(resp_click, _RE_LINK_AUTOS)
+                self._salvar_html_debug(
+                    click_html, "busca_direta_resposta_click", numero_processo,
+                    erro=link_match is None
+                )
             
             if resp_click.status_code == 200:
-                click_html = resp_click.text
-                
                 # Procurar link com idProcesso e ca
-                link_pattern = r'listAutosDigitais\.seam\?idProcesso=(\d+)(?:&amp;|&)ca=([a-f0-9]+)'
-                link_match = re.search(link_pattern, click_html)
-                
                 if link_match:
                     resultado.encontrado = True
                     resultado.id_processo = int(link_match.group(1))
@@ -567,12 +1315,11 @@ class ProcessSearchService:
                     return resultado
                 
                 # Procurar só idProcesso
-                id_pattern = r'idProcesso["\']?\s*[:=]\s*["\']?(\d+)'
-                id_match = re.search(id_pattern, click_html)
+                id_match = _RE_ID_PROCESSO.search(click_html) if "idProcesso" in click_html else None
                 
                 if id_match:
                     resultado.id_processo = int(id_match.group(1))
-                    self.logger.debug(f"[BUSCA_DIRETA] idProcesso encontrado: {resultado.id_processo}")
+                    self.logger.debug("[BUSCA_DIRETA] idProcesso encontrado: %s", resultado.id_processo)
                     
                     # Gerar chave via API
                     resultado.chave_acesso = self.gerar_chave_acesso(resultado.id_processo) or ""
@@ -585,35 +1332,63 @@ class ProcessSearchService:
                 
                 # Log para debug
                 self.logger.debug("[BUSCA_DIRETA] Padrões não encontrados no click response")
-                self.logger.debug(f"[BUSCA_DIRETA] Contém 'listAutosDigitais': {'listAutosDigitais' in click_html}")
-                self.logger.debug(f"[BUSCA_DIRETA] Contém 'idProcesso': {'idProcesso' in click_html}")
+                self.logger.debug("[BUSCA_DIRETA] Contém 'listAutosDigitais': %s", 'listAutosDigitais' in click_html)
+                self.logger.debug("[BUSCA_DIRETA] Contém 'idProcesso': %s", 'idProcesso' in click_html)
             
             self.logger.info("[BUSCA_DIRETA] ❌ Não foi possível obter idProcesso e ca")
             return resultado
             
         except Exception as e:
             self.logger.error(f"[BUSCA_DIRETA] ❌ EXCEÇÃO: {type(e).__name__}: {str(e)}")
-            import traceback
             self.logger.error(f"[BUSCA_DIRETA] Traceback:\n{traceback.format_exc()}")
             return resultado
     
+    @staticmethod
+    def _ler_ate_padrao(
+        resp: requests.Response,
+        padrao: "re.Pattern[str]",
+        tamanho_bloco: int = 16384,
+        blocos: Optional[Iterable[str]] = None
+    ) -> Tuple[Optional["re.Match[str]"], str]:
+        """
+        Lê resposta em streaming até encontrar o padrão.
+        
+        Args:
+            blocos: Iterador de texto já aberto sobre resp (opcional)
+        
+        Returns:
+            Tupla (match ou None, texto lido até o ponto de parada)
+        """
+        if blocos is None:
+            resp.encoding = resp.encoding or "utf-8"
+            blocos = resp.iter_content(chunk_size=tamanho_bloco, decode_unicode=True)
+        texto = ""
+        inicio = 0
+        try:
+            for bloco in blocos:
+                texto += bloco
+                match = padrao.search(texto, inicio)
+                # Match encostado no fim do bloco pode estar truncado
+                # (ex.: dígitos do id); confirma com o próximo bloco
+                if match and match.end() < len(texto):
+                    return match, texto
+                # Sobreposição para não perder matches entre blocos
+                inicio = match.start() if match else max(0, len(texto) - _SOBREPOSICAO_STREAM)
+        finally:
+            resp.close()
+        return padrao.search(texto, inicio), texto
+    
     def _encontrar_botao_pesquisa(self, html: str) -> str:
         """Encontra o ID do botão de pesquisa no formulário."""
         # Procurar por botões de submit no formulário
         # Padrão comum: fPP:j_id455 ou similar
-        patterns = [
-            r'(fPP:j_id\d+)"\s*(?:type="submit"|value="Pesquisar")',
-            r'(fPP:j_id\d+).*?Pesquisar',
-            r'name="(fPP:j_id\d+)".*?submit',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        if "fPP:j_id" in html:
+            match = _RE_BOTAO_PESQUISA.search(html)
             if match:
-                return match.group(1)
+                return match.group(match.lastindex)
         
         # Default
-        return "fPP:j_id455"
+        return _BOTAO_PESQUISA_PADRAO
 
     def _buscar_via_consulta_publica(self, numero_processo: str) -> ResultadoBusca:
         """Busca processo via página de consulta pública (método alternativo)."""
@@ -629,131 +1404,236 @@ class ProcessSearchService:
         try:
             self.logger.debug("[PAINEL_TAREFAS] Obtendo lista de tarefas...")
             
-            resp_tarefas = self.client.api_post(
-                "painelUsuario/tarefas",
-                {"numeroProcesso": "", "competencia": "", "etiquetas": []}
+            # OTIMIZAÇÃO: a listagem das favoritas já segue em paralelo; se o
+            # processo não estiver nas tarefas comuns, ela está pronta
+            futuro_fav = self._submeter_consulta(
+                self._listar_tarefas_painel, numero_processo, True
             )
             
-            self.logger.info(f"[PAINEL_TAREFAS] Response tarefas: HTTP {resp_tarefas.status_code}")
-            
-            if resp_tarefas.status_code != 200:
-                self.logger.error(f"[PAINEL_TAREFAS] ❌ Erro HTTP {resp_tarefas.status_code}")
+            tarefas = self._listar_tarefas_painel(numero_processo, favoritas=False)
+            if tarefas is None:
+                futuro_fav.cancel()
                 return resultado
             
-            tarefas = resp_tarefas.json()
             self.logger.info(f"[PAINEL_TAREFAS] Total de tarefas: {len(tarefas)}")
             
             # Buscar em cada tarefa
-            for i, tarefa in enumerate(tarefas[:10], 1):
-                nome_tarefa = tarefa.get("nome", "")
-                qtd = tarefa.get("quantidadePendente", 0)
-                
-                if not nome_tarefa:
-                    continue
-                
-                self.logger.debug(f"[PAINEL_TAREFAS] [{i}/10] Tarefa: '{nome_tarefa}' ({qtd} pendentes)")
-                
-                from urllib.parse import quote
-                endpoint = f"painelUsuario/recuperarProcessosTarefaPendenteComCriterios/{quote(nome_tarefa)}/false"
-                
-                resp_proc = self.client.api_post(
-                    endpoint,
-                    {
-                        "numeroProcesso": numero_processo,
-                        "classe": None,
-                        "tags": [],
-                        "page": 0,
-                        "maxResults": 1,
-                        "competencia": ""
-                    }
-                )
-                
-                if resp_proc.status_code == 200:
-                    data = resp_proc.json()
-                    entities = data.get("entities", [])
-                    
-                    self.logger.debug(f"[PAINEL_TAREFAS]   Resultados: {len(entities)}")
-                    
-                    if entities:
-                        proc = entities[0]
-                        if proc.get("numeroProcesso") == numero_processo:
-                            resultado.encontrado = True
-                            resultado.id_processo = proc.get("idProcesso", 0)
-                            resultado.metodo_busca = "painel_tarefas"
-                            resultado.detalhes["tarefa"] = nome_tarefa
-                            
-                            # Gerar chave de acesso
-                            resultado.chave_acesso = self.gerar_chave_acesso(resultado.id_processo) or ""
-                            
-                            self.logger.info(f"[PAINEL_TAREFAS] ✅ Encontrado na tarefa '{nome_tarefa}'!")
-                            return resultado
-                else:
-                    self.logger.debug(f"[PAINEL_TAREFAS]   Erro HTTP {resp_proc.status_code}")
+            payload = {
+                "numeroProcesso": numero_processo,
+                "classe": None,
+                "tags": [],
+                "page": 0,
+                "maxResults": 1,
+                "competencia": ""
+            }
+            tarefas = tarefas[:10]
+            achado = self._consultar_tarefas_em_paralelo(
+                numero_processo, tarefas, payload, favoritas=False
+            )
+            if achado:
+                futuro_fav.cancel()
+                return self._resultado_tarefa(resultado, *achado, metodo="painel_tarefas")
             
             # Tentar nas favoritas
             self.logger.debug("[PAINEL_TAREFAS] Buscando nas favoritas...")
             
-            resp_fav = self.client.api_post(
-                "painelUsuario/tarefasFavoritas",
-                {"numeroProcesso": "", "competencia": "", "etiquetas": []}
-            )
+            tarefas_fav = futuro_fav.result()
             
-            if resp_fav.status_code == 200:
-                tarefas_fav = resp_fav.json()
+            if tarefas_fav is not None:
                 self.logger.info(f"[PAINEL_TAREFAS] Total de favoritas: {len(tarefas_fav)}")
                 
-                for i, tarefa in enumerate(tarefas_fav[:5], 1):
-                    nome_tarefa = tarefa.get("nome", "")
-                    if not nome_tarefa:
-                        continue
-                    
-                    self.logger.debug(f"[PAINEL_TAREFAS] [{i}/5] Favorita: '{nome_tarefa}'")
-                    
-                    from urllib.parse import quote
-                    endpoint = f"painelUsuario/recuperarProcessosTarefaPendenteComCriterios/{quote(nome_tarefa)}/true"
-                    
-                    resp_proc = self.client.api_post(
-                        endpoint,
-                        {"numeroProcesso": numero_processo, "page": 0, "maxResults": 1}
+                # OTIMIZAÇÃO: a consulta geral de uma tarefa já cobre os
+                # processos dela como favorita; não repete o round-trip
+                sondadas = {t.get("nome") for t in tarefas}
+                tarefas_fav = [t for t in tarefas_fav if t.get("nome") not in sondadas]
+                
+                achado = self._consultar_tarefas_em_paralelo(
+                    numero_processo,
+                    tarefas_fav[:5],
+                    {"numeroProcesso": numero_processo, "page": 0, "maxResults": 1},
+                    favoritas=True
+                )
+                if achado:
+                    return self._resultado_tarefa(
+                        resultado, *achado, metodo="painel_tarefas_favoritas"
                     )
-                    
-                    if resp_proc.status_code == 200:
-                        data = resp_proc.json()
-                        entities = data.get("entities", [])
-                        
-                        if entities:
-                            proc = entities[0]
-                            if proc.get("numeroProcesso") == numero_processo:
-                                resultado.encontrado = True
-                                resultado.id_processo = proc.get("idProcesso", 0)
-                                resultado.metodo_busca = "painel_tarefas_favoritas"
-                                resultado.detalhes["tarefa"] = nome_tarefa
-                                resultado.chave_acesso = self.gerar_chave_acesso(resultado.id_processo) or ""
-                                self.logger.info(f"[PAINEL_TAREFAS] ✅ Encontrado na favorita '{nome_tarefa}'!")
-                                return resultado
             
             self.logger.info("[PAINEL_TAREFAS] ❌ Não encontrado em nenhuma tarefa")
             return resultado
             
         except Exception as e:
             self.logger.error(f"[PAINEL_TAREFAS] ❌ EXCEÇÃO: {type(e).__name__}: {str(e)}")
-            import traceback
-            self.logger.debug(f"[PAINEL_TAREFAS] Traceback:\n{traceback.format_exc()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("[PAINEL_TAREFAS] Traceback:\n%s", traceback.format_exc())
             return resultado
 
+    def _resultado_tarefa(
+        self,
+        resultado: ResultadoBusca,
+        proc: Dict[str, Any],
+        nome_tarefa: str,
+        metodo: str
+    ) -> ResultadoBusca:
+        """Preenche o resultado encontrado numa tarefa do painel."""
+        resultado.encontrado = True
+        resultado.id_processo = proc.get("idProcesso", 0)
+        resultado.metodo_busca = metodo
+        resultado.detalhes["tarefa"] = nome_tarefa
+        resultado.chave_acesso = self._chave_da_entidade(proc, resultado.id_processo)
+        origem = "favorita" if metodo == "painel_tarefas_favoritas" else "tarefa"
+        self.logger.info(f"[PAINEL_TAREFAS] ✅ Encontrado na {origem} '{nome_tarefa}'!")
+        return resultado
+
+    def _listar_tarefas_painel(
+        self,
+        numero_processo: str,
+        favoritas: bool
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lista as tarefas (ou favoritas) do painel que podem conter o processo.
+        
+        OTIMIZAÇÃO: o próprio filtro do painel restringe a listagem às
+        tarefas que contêm o processo; tarefas sem pendências são
+        descartadas e a listagem fica em cache por _PAINEL_TTL.
+        
+        Returns:
+            Lista de tarefas, ou None em caso de erro HTTP
+        """
+        chave = (numero_processo, favoritas)
+        with self._cache_lock:
+            cached = self._cache_painel.get(chave)
+        if cached and time.time() - cached[0] < _PAINEL_TTL:
+            return cached[1]
+        
+        endpoint = "painelUsuario/tarefasFavoritas" if favoritas else "painelUsuario/tarefas"
+        filtro_painel = {"numeroProcesso": numero_processo, "competencia": "", "etiquetas": []}
+        resp = self.client.api_post(endpoint, filtro_painel)
+        
+        self.logger.info(f"[PAINEL_TAREFAS] Response {endpoint}: HTTP {resp.status_code}")
+        
+        if resp.status_code != 200:
+            if not favoritas:
+                self.logger.error(f"[PAINEL_TAREFAS] ❌ Erro HTTP {resp.status_code}")
+            return None
+        
+        tarefas = [t for t in self.client.json(resp) if t.get("quantidadePendente", 1) > 0]
+        
+        agora = time.time()
+        with self._cache_lock:
+            # Descarta entradas vencidas para o cache não crescer sem limite
+            for k, (ts, _) in list(self._cache_painel.items()):
+                if agora - ts >= _PAINEL_TTL:
+                    del self._cache_painel[k]
+            self._cache_painel[chave] = (agora, tarefas)
+        return tarefas
+    
+    def _consultar_tarefas_em_paralelo(
+        self,
+        numero_processo: str,
+        tarefas: List[Dict[str, Any]],
+        payload: Dict[str, Any],
+        favoritas: bool
+    ) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Consulta o processo em várias tarefas ao mesmo tempo.
+        
+        Returns:
+            Tupla (processo, nome_tarefa) da primeira tarefa que contém
+            o processo, ou None
+        """
+        # dict.fromkeys: nomes repetidos na listagem viram uma única consulta
+        nomes = list(dict.fromkeys(t["nome"] for t in tarefas if t.get("nome")))
+        if not nomes:
+            return None
+        
+        # OTIMIZAÇÃO: um POST por tarefa, todos em voo ao mesmo tempo;
+        # retorna no primeiro acerto
+        futures = {
+            self._submeter_consulta(
+                self.client.api_post,
+                endpoint_processos_tarefa(nome, favoritas),
+                payload
+            ): nome
+            for nome in nomes
+        }
+        try:
+            for future in as_completed(futures):
+                nome_tarefa = futures[future]
+                try:
+                    resp_proc = future.result()
+                except Exception as e:
+                    self.logger.debug("[PAINEL_TAREFAS]   Erro em '%s': %s", nome_tarefa, type(e).__name__)
+                    continue
+                
+                if resp_proc.status_code != 200:
+                    self.logger.debug("[PAINEL_TAREFAS]   Erro HTTP %s em '%s'", resp_proc.status_code, nome_tarefa)
+                    continue
+                
+                entities = self.client.json(resp_proc).get("entities", [])
+                self.logger.debug("[PAINEL_TAREFAS]   '%s': %s resultados", nome_tarefa, len(entities))
+                
+                if entities and entities[0].get("numeroProcesso") == numero_processo:
+                    return entities[0], nome_tarefa
+            
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
     def _buscar_via_etiquetas(self, numero_processo: str) -> ResultadoBusca:
-        """Busca processo nas etiquetas do usuário."""
+        """
+        Busca processo nas etiquetas do usuário.
+        
+        Sonda primeiro a última etiqueta em que o processo foi encontrado,
+        se houver.
+        
+        Args:
+            numero_processo: Número CNJ normalizado
+        """
         resultado = ResultadoBusca(numero_processo=numero_processo)
         
         self.logger.info(f"[ETIQUETAS] ----- Iniciando -----")
         
         try:
+            # OTIMIZAÇÃO: com uma dica, filtra as etiquetas no servidor
+            # (tagsString) e sonda só as que casam, antes da varredura geral
+            hint = self._ler_dica_etiqueta(numero_processo)
+            sondadas = set()
+            futuro_lista: Optional[Future] = None
+            
+            if hint:
+                self.logger.debug("[ETIQUETAS] Usando dica de etiqueta: %s", hint)
+                # OTIMIZAÇÃO: a listagem geral já segue em paralelo; se a
+                # dica falhar, a varredura começa sem esperar outro RTT
+                futuro_lista = self._submeter_consulta(
+                    self.client.api_post,
+                    "painelUsuario/etiquetas",
+                    {"page": 0, "maxResults": 50, "tagsString": ""}
+                )
+                resp_dica = self.client.api_post(
+                    "painelUsuario/etiquetas",
+                    {"page": 0, "maxResults": 50, "tagsString": hint}
+                )
+                if resp_dica.status_code == 200:
+                    candidatas = [
+                        e for e in self.client.json(resp_dica).get("entities", []) if e.get("id")
+                    ]
+                    sondadas.update(e["id"] for e in candidatas)
+                    achado = self._procurar_nas_etiquetas(numero_processo, candidatas)
+                    if achado:
+                        futuro_lista.cancel()
+                        return self._resultado_etiqueta(resultado, *achado)
+                    self.logger.debug("[ETIQUETAS] Dica sem acerto, varrendo etiquetas")
+            
             self.logger.debug("[ETIQUETAS] Obtendo lista de etiquetas...")
             
-            resp_etiquetas = self.client.api_post(
-                "painelUsuario/etiquetas",
-                {"page": 0, "maxResults": 50, "tagsString": ""}
-            )
+            if futuro_lista is not None:
+                resp_etiquetas = futuro_lista.result()
+            else:
+                resp_etiquetas = self.client.api_post(
+                    "painelUsuario/etiquetas",
+                    {"page": 0, "maxResults": 50, "tagsString": ""}
+                )
             
             self.logger.info(f"[ETIQUETAS] Response: HTTP {resp_etiquetas.status_code}")
             
@@ -761,65 +1641,228 @@ class ProcessSearchService:
                 self.logger.error(f"[ETIQUETAS] ❌ Erro HTTP {resp_etiquetas.status_code}")
                 return resultado
             
-            data = resp_etiquetas.json()
+            data = self.client.json(resp_etiquetas)
             etiquetas = data.get("entities", [])
             
             self.logger.info(f"[ETIQUETAS] Total de etiquetas: {len(etiquetas)}")
             
-            for i, etiqueta in enumerate(etiquetas[:15], 1):
-                id_etiqueta = etiqueta.get("id")
-                nome_etiqueta = etiqueta.get("nomeTag", "")
-                
-                if not id_etiqueta:
-                    continue
-                
-                self.logger.debug(f"[ETIQUETAS] [{i}/15] Etiqueta: '{nome_etiqueta}' (ID={id_etiqueta})")
-                
-                resp_proc = self.client.api_get(
-                    f"painelUsuario/etiquetas/{id_etiqueta}/processos",
-                    params={"limit": 500}
-                )
-                
-                if resp_proc.status_code == 200:
-                    processos = resp_proc.json()
-                    self.logger.debug(f"[ETIQUETAS]   Processos: {len(processos)}")
-                    
-                    for proc in processos:
-                        if proc.get("numeroProcesso") == numero_processo:
-                            resultado.encontrado = True
-                            resultado.id_processo = proc.get("idProcesso", 0)
-                            resultado.metodo_busca = "etiquetas"
-                            resultado.detalhes["etiqueta"] = nome_etiqueta
-                            resultado.chave_acesso = self.gerar_chave_acesso(resultado.id_processo) or ""
-                            self.logger.info(f"[ETIQUETAS] ✅ Encontrado na etiqueta '{nome_etiqueta}'!")
-                            return resultado
-                else:
-                    self.logger.debug(f"[ETIQUETAS]   Erro HTTP {resp_proc.status_code}")
+            candidatas = [
+                e for e in etiquetas[:15] if e.get("id") and e["id"] not in sondadas
+            ]
+            achado = self._procurar_nas_etiquetas(numero_processo, candidatas)
+            if achado:
+                return self._resultado_etiqueta(resultado, *achado)
             
             self.logger.info("[ETIQUETAS] ❌ Não encontrado em nenhuma etiqueta")
             return resultado
             
         except Exception as e:
             self.logger.error(f"[ETIQUETAS] ❌ EXCEÇÃO: {type(e).__name__}: {str(e)}")
-            import traceback
-            self.logger.debug(f"[ETIQUETAS] Traceback:\n{traceback.format_exc()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("[ETIQUETAS] Traceback:\n%s", traceback.format_exc())
             return resultado
+    
+    def _procurar_nas_etiquetas(
+        self,
+        numero_processo: str,
+        etiquetas: List[Dict[str, Any]]
+    ) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Procura o processo nas etiquetas informadas.
+        
+        Returns:
+            Tupla (processo, nome_etiqueta) da primeira etiqueta que contém
+            o processo, ou None
+        """
+        # OTIMIZAÇÃO: etiquetas lidas há pouco (buscas em lote) respondem
+        # pelo índice em memória, sem nova requisição
+        agora = time.time()
+        a_consultar = []
+        for etiqueta in etiquetas:
+            with self._cache_lock:
+                cached = self._indice_etiquetas.get(etiqueta["id"])
+            if cached is None or agora - cached[0] >= _ETIQUETA_INDICE_TTL:
+                a_consultar.append(etiqueta)
+                continue
+            proc = cached[1].get(numero_processo)
+            if proc is not None:
+                self.logger.debug("[ETIQUETAS]   '%s': acerto no índice em cache", etiqueta.get("nomeTag", ""))
+                return proc, etiqueta.get("nomeTag", "")
+        
+        # OTIMIZAÇÃO: GETs das etiquetas em paralelo, numa janela de até
+        # _MAX_ETIQUETAS_EM_VOO por busca (não monopoliza o pool de
+        # consultas compartilhado); retorna na primeira que contém o processo
+        candidatas = iter(a_consultar)
+        futures: Dict[Future, Dict[str, Any]] = {}
+        
+        def submeter(quantidade: int) -> List[Future]:
+            novos = []
+            for etiqueta in islice(candidatas, quantidade):
+                future = self._submeter_consulta(
+                    self.client.api_get,
+                    f"painelUsuario/etiquetas/{etiqueta['id']}/processos",
+                    params={"limit": 500},
+                    stream=True
+                )
+                futures[future] = etiqueta
+                novos.append(future)
+            return novos
+        
+        pendentes = set(submeter(_MAX_ETIQUETAS_EM_VOO))
+        try:
+            while pendentes:
+                concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for future in concluidos:
+                    nome_etiqueta = futures[future].get("nomeTag", "")
+                    try:
+                        resp_proc = future.result()
+                    except Exception as e:
+                        self.logger.debug("[ETIQUETAS]   Erro em '%s': %s", nome_etiqueta, type(e).__name__)
+                        continue
+                    
+                    if resp_proc.status_code != 200:
+                        resp_proc.close()
+                        self.logger.debug("[ETIQUETAS]   Erro HTTP %s em '%s'", resp_proc.status_code, nome_etiqueta)
+                        continue
+                    
+                    proc, lidos, indice = self._procurar_processo_em_lista(resp_proc, numero_processo)
+                    self.logger.debug("[ETIQUETAS]   '%s': %s processos lidos", nome_etiqueta, lidos)
+                    if indice is not None:
+                        self._gravar_indice_etiqueta(futures[future]["id"], indice)
+                    
+                    if proc:
+                        return proc, nome_etiqueta
+                
+                # Repõe a janela com as próximas etiquetas
+                pendentes.update(submeter(len(concluidos)))
+        finally:
+            # Respostas em streaming não consumidas precisam ser fechadas
+            # para devolver a conexão ao pool (que é bloqueante)
+            for future in futures:
+                if not future.cancel():
+                    future.add_done_callback(_fechar_resposta)
+        
+        return None
+    
+    def _resultado_etiqueta(
+        self,
+        resultado: ResultadoBusca,
+        proc: Dict[str, Any],
+        nome_etiqueta: str
+    ) -> ResultadoBusca:
+        """Preenche o resultado encontrado via etiqueta e memoriza a dica."""
+        resultado.encontrado = True
+        resultado.id_processo = proc.get("idProcesso", 0)
+        resultado.metodo_busca = "etiquetas"
+        resultado.detalhes["etiqueta"] = nome_etiqueta
+        resultado.chave_acesso = self._chave_da_entidade(proc, resultado.id_processo)
+        self._gravar_dica_etiqueta(resultado.numero_processo, nome_etiqueta)
+        self.logger.info(f"[ETIQUETAS] ✅ Encontrado na etiqueta '{nome_etiqueta}'!")
+        return resultado
+    
+    def _gravar_indice_etiqueta(self, id_etiqueta: int, indice: Dict[str, Dict[str, Any]]):
+        """Guarda o índice de uma etiqueta lida por inteiro."""
+        agora = time.time()
+        with self._cache_lock:
+            # Descarta entradas vencidas para o cache não crescer sem limite
+            for k, (ts, _) in list(self._indice_etiquetas.items()):
+                if agora - ts >= _ETIQUETA_INDICE_TTL:
+                    del self._indice_etiquetas[k]
+            self._indice_etiquetas[id_etiqueta] = (agora, indice)
+    
+    def _ler_dica_etiqueta(self, numero: str) -> Optional[str]:
+        """Última etiqueta em que o processo foi encontrado, se conhecida."""
+        with self._cache_lock:
+            nome = self._dicas_etiqueta.get(numero)
+            if nome is not None:
+                self._dicas_etiqueta.move_to_end(numero)
+            return nome
+    
+    def _gravar_dica_etiqueta(self, numero: str, nome_etiqueta: str):
+        """Memoriza a etiqueta do processo no LRU de dicas."""
+        if not nome_etiqueta:
+            return
+        with self._cache_lock:
+            self._dicas_etiqueta[numero] = nome_etiqueta
+            self._dicas_etiqueta.move_to_end(numero)
+            if len(self._dicas_etiqueta) > _MAX_DICAS_ETIQUETA:
+                self._dicas_etiqueta.popitem(last=False)
+
+    @staticmethod
+    def _procurar_processo_em_lista(
+        resp: requests.Response,
+        numero_processo: str
+    ) -> Tuple[Optional[Dict[str, Any]], int, Optional[Dict[str, Dict[str, Any]]]]:
+        """
+        Procura o processo numa lista JSON aberta com stream=True.
+        
+        Com ijson, os itens são lidos um a um e a leitura para no primeiro
+        acerto; sem ijson, o documento é carregado inteiro.
+        
+        Returns:
+            Tupla (processo ou None, quantidade de itens lidos, índice
+            numeroProcesso -> processo se a lista foi lida inteira)
+        """
+        try:
+            if ijson is None:
+                processos = json_loads(resp.content)
+                indice = {p.get("numeroProcesso"): p for p in processos}
+                return indice.get(numero_processo), len(processos), indice
+            
+            resp.raw.decode_content = True
+            indice = {}
+            for proc in ijson.items(resp.raw, "item"):
+                numero = proc.get("numeroProcesso")
+                if numero == numero_processo:
+                    return proc, len(indice) + 1, None
+                indice[numero] = proc
+            return None, len(indice), indice
+        finally:
+            resp.close()
+
+    def _chave_da_entidade(self, proc: Dict[str, Any], id_processo: int) -> str:
+        """Chave de acesso embutida na entidade ou, na falta dela, gerada."""
+        # OTIMIZAÇÃO: se o PJE já mandou a chave junto do processo, economiza
+        # o round-trip de gerarChaveAcessoProcesso
+        for campo in _CAMPOS_CHAVE_ACESSO:
+            chave = proc.get(campo)
+            if chave:
+                self.logger.debug("[GERAR_CA] Chave embutida na entidade (%s)", campo)
+                return str(chave)
+        return self.gerar_chave_acesso(id_processo) or ""
 
     def gerar_chave_acesso(self, id_processo: int) -> Optional[str]:
         """Gera chave de acesso para um processo já conhecido."""
-        self.logger.debug(f"[GERAR_CA] Gerando chave para ID={id_processo}")
+        # OTIMIZAÇÃO: chaves recém-geradas são reaproveitadas por alguns
+        # minutos (reaberturas e fallback de buscar_e_acessar_processo)
+        with self._cache_lock:
+            cached = self._cache_chaves.get(id_processo)
+            if cached is not None:
+                if time.monotonic() - cached[1] < _CHAVE_ACESSO_TTL:
+                    self._cache_chaves.move_to_end(id_processo)
+                    self.logger.debug("[GERAR_CA] ✓ Chave em cache para ID=%s", id_processo)
+                    return cached[0]
+                del self._cache_chaves[id_processo]
+        
+        self.logger.debug("[GERAR_CA] Gerando chave para ID=%s", id_processo)
         
         try:
             resp = self.client.api_get(f"painelUsuario/gerarChaveAcessoProcesso/{id_processo}")
             
-            self.logger.debug(f"[GERAR_CA] Response: HTTP {resp.status_code}")
+            self.logger.debug("[GERAR_CA] Response: HTTP %s", resp.status_code)
             
             if resp.status_code == 200:
                 chave = resp.text.strip().strip('"')
-                self.logger.debug(f"[GERAR_CA] ✅ Chave: {chave[:30]}...")
+                self.logger.debug("[GERAR_CA] ✅ Chave: %s...", chave[:30])
+                if chave:
+                    with self._cache_lock:
+                        self._cache_chaves[id_processo] = (chave, time.monotonic())
+                        self._cache_chaves.move_to_end(id_processo)
+                        if len(self._cache_chaves) > _MAX_CACHE_CHAVES:
+                            self._cache_chaves.popitem(last=False)
                 return chave
             else:
-                self.logger.debug(f"[GERAR_CA] ❌ Erro HTTP {resp.status_code}")
+                self.logger.debug("[GERAR_CA] ❌ Erro HTTP %s", resp.status_code)
             
             return None
             
@@ -837,17 +1880,18 @@ class ProcessSearchService:
                 f"listAutosDigitais.seam?idProcesso={id_processo}&ca={chave_acesso}&aba="
             )
             
-            self.logger.debug(f"[ACESSAR_DIRETO] URL: {url}")
+            self.logger.debug("[ACESSAR_DIRETO] URL: %s", url)
             
             resp = self.client.session.get(
                 url, timeout=self.client.timeout,
-                headers={
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Referer": f"{BASE_URL}/pje/Processo/ConsultaProcesso/listView.seam?iframe=true"
-                }
+                headers=_HEADERS_ACESSO_DIRETO
             )
             
-            self.logger.info(f"[ACESSAR_DIRETO] Response: HTTP {resp.status_code} ({len(resp.text)} bytes)")
+            self.logger.info(
+                "[ACESSAR_DIRETO] Response: HTTP %s (%s bytes, %s)",
+                resp.status_code, len(resp.content),
+                resp.headers.get("Content-Encoding", "sem compressão")
+            )
             
             if resp.status_code == 200:
                 self.logger.info(f"[ACESSAR_DIRETO] ✅ Sucesso!")
@@ -869,7 +1913,10 @@ class ProcessSearchService:
         resultado = self.buscar_processo(numero_processo)
         
         if not resultado.encontrado:
-            self.logger.warning(f"[BUSCAR_E_ACESSAR] ❌ Processo não encontrado")
+            if resultado.inconclusivo:
+                self.logger.warning(f"[BUSCAR_E_ACESSAR] ⚠️ Busca inconclusiva (tempo esgotado)")
+            else:
+                self.logger.warning(f"[BUSCAR_E_ACESSAR] ❌ Processo não encontrado")
             return resultado, None
         
         if not resultado.chave_acesso:
@@ -882,4 +1929,55 @@ class ProcessSearchService:
             return resultado, html
         
         self.logger.warning("[BUSCAR_E_ACESSAR] ⚠️ Sem chave de acesso, não foi possível acessar")
-        return resultado, None
\ No newline at end of file
+        return resultado, None
+
+    def buscar_e_acessar_processos(
+        self,
+        numeros_processos: Iterable[str],
+        max_paralelo: int = _MAX_PROCESSOS_EM_LOTE
+    ) -> Dict[str, Tuple[ResultadoBusca, Optional[str]]]:
+        """
+        Busca e acessa vários processos, vários ao mesmo tempo.
+        
+        Números repetidos são buscados uma única vez; sessão, cookies e
+        pool de conexões são compartilhados por todo o lote.
+        
+        Args:
+            numeros_processos: Números CNJ (formatados ou não)
+            max_paralelo: Máximo de processos em andamento simultâneo
+        
+        Returns:
+            Dict número informado -> (ResultadoBusca, HTML dos autos ou None)
+        """
+        numeros = list(dict.fromkeys(n for n in numeros_processos if n))
+        if not numeros:
+            return {}
+        
+        self.logger.info(f"[BUSCAR_E_ACESSAR] Lote de {len(numeros)} processos")
+        
+        resultados: Dict[str, Tuple[ResultadoBusca, Optional[str]]] = {}
+        # Executor próprio: buscar_processo já ocupa self._executor com as
+        # estratégias, e o lote não pode disputar essas vagas
+        with ThreadPoolExecutor(
+            max_workers=min(max_paralelo, len(numeros)),
+            thread_name_prefix="pje-lote"
+        ) as executor:
+            futures = {
+                executor.submit(self.buscar_e_acessar_processo, numero): numero
+                for numero in numeros
+            }
+            for future in as_completed(futures):
+                numero = futures[future]
+                try:
+                    resultados[numero] = future.result()
+                except Exception as e:
+                    self.logger.error(f"[BUSCAR_E_ACESSAR] ❌ {numero}: {type(e).__name__}: {e}")
+                    resultados[numero] = (ResultadoBusca(numero_processo=numero), None)
+        
+        encontrados = sum(1 for r, _ in resultados.values() if r.encontrado)
+        inconclusivos = sum(1 for r, _ in resultados.values() if r.inconclusivo)
+        self.logger.info(
+            f"[BUSCAR_E_ACESSAR] Lote concluído: {encontrados}/{len(numeros)} encontrados"
+            f", {inconclusivos} inconclusivos"
+        )
+        return resultados
\ No newline at end of file
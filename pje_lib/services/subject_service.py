@@ -1,12 +1,23 @@
-from typing import List, Dict, Optional, Set
+import time
+from typing import Iterator, List, Dict, Optional, Set
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..core import PJEHttpClient
 from ..models import Tarefa, ProcessoTarefa, AssuntoPrincipal
-from ..utils import delay, get_logger
+from ..utils import get_logger
 from .task_service import TaskService
 
 
+# OTIMIZAÇÃO: limite de tarefas listadas simultaneamente; cada tarefa ja
+# pagina em paralelo internamente, entao um teto baixo evita saturar o pool.
+_MAX_TAREFAS_EM_PARALELO = 8
+
+# Intervalo minimo (s) entre chamadas do callback de progresso; a ultima
+# tarefa sempre e reportada
+_INTERVALO_PROGRESSO = 0.1
+
+
 class SubjectService:
     """Serviço para análise e agrupamento de processos por assunto principal."""
     
@@ -46,6 +57,22 @@ class SubjectService:
         """
         return self.task_service.listar_tarefas(force_refresh)
     
+    def iter_tarefas_ativas(self, tarefas: List[Tarefa] = None) -> Iterator[Tarefa]:
+        """
+        Itera as tarefas que entram na análise (não ignoradas, não favoritas).
+        
+        Args:
+            tarefas: Lista de origem (None = tarefas disponíveis)
+        """
+        if tarefas is None:
+            tarefas = self.listar_tarefas_disponiveis()
+        
+        ignoradas = self._tarefas_ignoradas
+        return (
+            t for t in tarefas
+            if t.nome not in ignoradas and not t.favorita
+        )
+    
     def analisar_assuntos_por_tarefas(
         self,
         tarefas: List[Tarefa] = None,
@@ -61,43 +88,58 @@ class SubjectService:
         Returns:
             Dict com assuntos e seus processos
         """
-        if tarefas is None:
-            tarefas = self.listar_tarefas_disponiveis()
-        
-        # Filtrar tarefas ignoradas
-        tarefas_para_analisar = [
-            t for t in tarefas 
-            if t.nome not in self._tarefas_ignoradas and not t.favorita
-        ]
+        tarefas_para_analisar = list(self.iter_tarefas_ativas(tarefas))
         
         self.logger.info(f"Analisando {len(tarefas_para_analisar)} tarefas")
         
         assuntos: Dict[str, AssuntoPrincipal] = {}
         total_tarefas = len(tarefas_para_analisar)
         
-        for idx, tarefa in enumerate(tarefas_para_analisar, 1):
-            self.logger.info(f"[{idx}/{total_tarefas}] Analisando: {tarefa.nome}")
-            
-            if callback_progresso:
-                callback_progresso(tarefa.nome, idx, total_tarefas)
-            
-            # Listar processos da tarefa
-            processos = self.task_service.listar_todos_processos_tarefa(
-                tarefa.nome,
-                apenas_favoritas=False
-            )
-            
-            self.logger.debug(f"  Processos encontrados: {len(processos)}")
-            
-            for proc in processos:
-                assunto = proc.assunto_principal or "Sem assunto definido"
-                
-                if assunto not in assuntos:
-                    assuntos[assunto] = AssuntoPrincipal(nome=assunto)
+        if total_tarefas:
+            # OTIMIZAÇÃO: as tarefas sao independentes; listamos em paralelo e
+            # agregamos os assuntos nesta thread, na ordem de conclusao, para
+            # que o callback de progresso avance a cada tarefa finalizada.
+            workers = min(_MAX_TAREFAS_EM_PARALELO, total_tarefas)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futuros = {
+                    executor.submit(
+                        self.task_service.listar_todos_processos_tarefa,
+                        tarefa.nome,
+                        apenas_favoritas=False
+                    ): tarefa
+                    for tarefa in tarefas_para_analisar
+                }
                 
-                assuntos[assunto].adicionar_processo(proc)
-            
-            delay(0.5, 1.0)
+                ultimo_aviso = 0.0
+                for idx, futuro in enumerate(as_completed(futuros), 1):
+                    tarefa = futuros[futuro]
+                    self.logger.info(f"[{idx}/{total_tarefas}] Analisada: {tarefa.nome}")
+                    
+                    # OTIMIZAÇÃO: limita a taxa de atualizacao da UI quando
+                    # varias tarefas terminam quase juntas
+                    if callback_progresso:
+                        agora = time.monotonic()
+                        if idx == total_tarefas or agora - ultimo_aviso >= _INTERVALO_PROGRESSO:
+                            ultimo_aviso = agora
+                            callback_progresso(tarefa.nome, idx, total_tarefas)
+                    
+                    try:
+                        processos = futuro.result()
+                    except Exception as e:
+                        self.logger.error(f"Erro ao listar processos de {tarefa.nome}: {e}")
+                        continue
+                    
+                    self.logger.debug("  Processos encontrados: %s", len(processos))
+                    
+                    for proc in processos:
+                        nome_assunto = proc.assunto_principal or "Sem assunto definido"
+                        
+                        # Uma consulta ao dict por processo (sem "in" + indexacao)
+                        assunto = assuntos.get(nome_assunto)
+                        if assunto is None:
+                            assunto = assuntos[nome_assunto] = AssuntoPrincipal(nome=nome_assunto)
+                        
+                        assunto.adicionar_processo(proc)
         
         # Ordenar por quantidade de processos (decrescente)
         assuntos_ordenados = dict(
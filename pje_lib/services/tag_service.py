@@ -6,7 +6,7 @@ from typing import List, Optional
 
 from ..core import PJEHttpClient
 from ..models import Etiqueta, Processo
-from ..utils import delay, get_logger
+from ..utils import get_logger
 
 
 class TagService:
@@ -19,24 +19,24 @@ class TagService:
     def buscar_etiquetas(self, busca: str = "", page: int = 0, max_results: int = 30) -> List[Etiqueta]:
         """Busca etiquetas pelo nome."""
         try:
-            self.logger.debug(f"Buscando etiquetas: '{busca}'")
+            self.logger.debug("Buscando etiquetas: '%s'", busca)
             resp = self.client.api_post(
                 "painelUsuario/etiquetas",
                 {"page": page, "maxResults": max_results, "tagsString": busca}
             )
             
-            self.logger.debug(f"Status: {resp.status_code}")
+            self.logger.debug("Status: %s", resp.status_code)
             
             if resp.status_code == 200:
-                data = resp.json()
-                self.logger.debug(f"Resposta: {data}")
+                data = self.client.json(resp)
+                self.logger.debug("Resposta: %s", data)
                 
                 etiquetas = [Etiqueta.from_dict(e) for e in data.get("entities", [])]
                 self.logger.info(f"Encontradas {len(etiquetas)} etiquetas")
                 return etiquetas
             else:
                 self.logger.error(f"Erro ao buscar etiquetas: {resp.status_code}")
-                self.logger.debug(f"Resposta: {resp.text[:500]}")
+                self.logger.debug("Resposta: %s", resp.text[:500])
         except Exception as e:
             self.logger.error(f"Erro ao buscar etiquetas: {e}")
         return []
@@ -56,22 +56,22 @@ class TagService:
             total = int(resp_total.text) if resp_total.status_code == 200 else 0
             self.logger.info(f"Total de processos: {total}")
             
-            delay()
-            
+            # OTIMIZAÇÃO: sem pausa artificial entre as duas requisicoes; o
+            # limitador do cliente HTTP ja controla o ritmo
             resp = self.client.api_get(
                 f"painelUsuario/etiquetas/{id_etiqueta}/processos",
                 params={"limit": limit}
             )
             
-            self.logger.debug(f"Status: {resp.status_code}")
+            self.logger.debug("Status: %s", resp.status_code)
             
             if resp.status_code == 200:
-                processos = [Processo.from_dict(p) for p in resp.json()]
+                processos = [Processo.from_dict(p) for p in self.client.json(resp)]
                 self.logger.info(f"Retornados {len(processos)} processos")
                 return processos
             else:
                 self.logger.error(f"Erro ao listar processos: {resp.status_code}")
-                self.logger.debug(f"Resposta: {resp.text[:500]}")
+                self.logger.debug("Resposta: %s", resp.text[:500])
         except Exception as e:
             self.logger.error(f"Erro ao listar processos: {e}")
         return []
\ No newline at end of file
@@ -3,14 +3,24 @@ Servico de gerenciamento de tarefas.
 """
 
 import unicodedata
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 from urllib.parse import quote
 
 from ..core import PJEHttpClient
 from ..models import Tarefa, ProcessoTarefa
-from ..utils import delay, get_logger
+from ..utils import get_logger
 
 
+# Paginacao de processos por tarefa
+_TAMANHO_PAGINA = 100
+_MAX_PAGINAS_EM_PARALELO = 5
+
+
+# OTIMIZAÇÃO: nomes de tarefas se repetem a cada busca; a normalizacao
+# unicode e pura, entao memoizamos o resultado.
+@lru_cache(maxsize=4096)
 def normalizar_texto(texto: str) -> str:
     """Remove acentos e converte para minusculo."""
     texto_normalizado = unicodedata.normalize('NFKD', texto)
@@ -18,6 +28,17 @@ def normalizar_texto(texto: str) -> str:
     return texto_sem_acento.lower().strip()
 
 
+# OTIMIZAÇÃO: o endpoint de processos e montado a cada pagina e a cada
+# sondagem de tarefa; o quote do nome e calculado uma unica vez por tarefa.
+@lru_cache(maxsize=1024)
+def endpoint_processos_tarefa(nome_tarefa: str, apenas_favoritas: bool = False) -> str:
+    """Monta o endpoint de processos pendentes de uma tarefa."""
+    return (
+        f"painelUsuario/recuperarProcessosTarefaPendenteComCriterios/"
+        f"{quote(nome_tarefa)}/{str(apenas_favoritas).lower()}"
+    )
+
+
 class TaskService:
     """Servico para tarefas e processos por tarefa."""
     
@@ -44,11 +65,11 @@ class TaskService:
                 {"numeroProcesso": "", "competencia": "", "etiquetas": []}
             )
             
-            self.logger.debug(f"Status: {resp.status_code}")
+            self.logger.debug("Status: %s", resp.status_code)
             
             if resp.status_code == 200:
-                todas = resp.json()
-                self.logger.debug(f"Resposta: {todas}")
+                todas = self.client.json(resp)
+                self.logger.debug("Resposta: %s", todas)
                 
                 self.tarefas_cache = [
                     Tarefa.from_dict(t) for t in todas 
@@ -58,7 +79,7 @@ class TaskService:
                 return self.tarefas_cache
             else:
                 self.logger.error(f"Erro ao listar tarefas: {resp.status_code}")
-                self.logger.debug(f"Resposta: {resp.text[:500]}")
+                self.logger.debug("Resposta: %s", resp.text[:500])
         except Exception as e:
             self.logger.error(f"Erro ao listar tarefas: {e}")
         return []
@@ -75,11 +96,11 @@ class TaskService:
                 {"numeroProcesso": "", "competencia": "", "etiquetas": []}
             )
             
-            self.logger.debug(f"Status: {resp.status_code}")
+            self.logger.debug("Status: %s", resp.status_code)
             
             if resp.status_code == 200:
-                todas = resp.json()
-                self.logger.debug(f"Resposta: {todas}")
+                todas = self.client.json(resp)
+                self.logger.debug("Resposta: %s", todas)
                 
                 self.tarefas_favoritas_cache = [
                     Tarefa.from_dict(t, favorita=True) for t in todas 
@@ -89,7 +110,7 @@ class TaskService:
                 return self.tarefas_favoritas_cache
             else:
                 self.logger.error(f"Erro ao listar favoritas: {resp.status_code}")
-                self.logger.debug(f"Resposta: {resp.text[:500]}")
+                self.logger.debug("Resposta: %s", resp.text[:500])
         except Exception as e:
             self.logger.error(f"Erro ao listar favoritas: {e}")
         return []
@@ -103,15 +124,20 @@ class TaskService:
         
         nome_normalizado = normalizar_texto(nome)
         
+        # Passagem unica: match exato tem prioridade, mas guardamos o
+        # primeiro match parcial para nao percorrer a lista de novo.
+        parcial = None
         for t in lista:
-            if normalizar_texto(t.nome) == nome_normalizado:
+            nome_tarefa = normalizar_texto(t.nome)
+            if nome_tarefa == nome_normalizado:
                 self.logger.info(f"Tarefa encontrada: {t.nome}")
                 return t
+            if parcial is None and nome_normalizado in nome_tarefa:
+                parcial = t
         
-        for t in lista:
-            if nome_normalizado in normalizar_texto(t.nome):
-                self.logger.info(f"Tarefa encontrada: {t.nome}")
-                return t
+        if parcial is not None:
+            self.logger.info(f"Tarefa encontrada: {parcial.nome}")
+            return parcial
         
         self.logger.warning(f"Tarefa '{nome}' nao encontrada")
         return None
@@ -122,32 +148,37 @@ class TaskService:
     ) -> Tuple[List[ProcessoTarefa], int]:
         """Lista processos de uma tarefa."""
         try:
-            endpoint = (
-                f"painelUsuario/recuperarProcessosTarefaPendenteComCriterios/"
-                f"{quote(nome_tarefa)}/{str(apenas_favoritas).lower()}"
-            )
+            endpoint = endpoint_processos_tarefa(nome_tarefa, apenas_favoritas)
             resp = self.client.api_post(endpoint, {
                 "numeroProcesso": "", "classe": None, "tags": [],
                 "page": page, "maxResults": max_results, "competencia": ""
             })
             if resp.status_code == 200:
-                data = resp.json()
+                data = self.client.json(resp)
                 return [ProcessoTarefa.from_dict(p) for p in data.get("entities", [])], data.get("count", 0)
         except Exception as e:
             self.logger.error(f"Erro ao listar processos: {e}")
         return [], 0
     
     def listar_todos_processos_tarefa(self, nome_tarefa: str, apenas_favoritas: bool = False) -> List[ProcessoTarefa]:
-        """Lista TODOS os processos (com paginacao)."""
-        todos = []
-        page = 0
-        while True:
-            processos, total = self.listar_processos_tarefa(nome_tarefa, page, 100, apenas_favoritas)
-            if not processos:
-                break
-            todos.extend(processos)
-            if len(todos) >= total:
-                break
-            page += 1
-            delay(0.5, 1.0)
+        """
+        Lista TODOS os processos (com paginacao).
+        
+        A primeira pagina informa o total; as demais sao buscadas em
+        paralelo (ate _MAX_PAGINAS_EM_PARALELO) e reunidas em ordem.
+        """
+        todos, total = self.listar_processos_tarefa(nome_tarefa, 0, _TAMANHO_PAGINA, apenas_favoritas)
+        if not todos or len(todos) >= total:
+            return todos
+        
+        num_paginas = -(-total // _TAMANHO_PAGINA)
+        with ThreadPoolExecutor(max_workers=_MAX_PAGINAS_EM_PARALELO) as executor:
+            paginas = executor.map(
+                lambda page: self.listar_processos_tarefa(
+                    nome_tarefa, page, _TAMANHO_PAGINA, apenas_favoritas
+                )[0],
+                range(1, num_paginas)
+            )
+            for processos in paginas:
+                todos.extend(processos)
         return todos
\ No newline at end of file
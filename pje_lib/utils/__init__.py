@@ -9,10 +9,60 @@ import random
 import unicodedata
 import logging
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 from difflib import SequenceMatcher
-from typing import Any, Optional, List, Callable
+from functools import lru_cache
+from typing import Any, Optional, List, Callable, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ImportError:  # rapidfuzz e opcional; cai no difflib
+    rf_fuzz = rf_process = None
+
+# Parser JSON: orjson (C, mais rapido) quando instalado
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Kwargs para @dataclass: slots=True so existe a partir do Python 3.10
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# OTIMIZAÇÃO: padroes compilados uma unica vez (nomes de pasta e ViewState)
+# e tabela de traducao para os caracteres proibidos em nomes de arquivo
+_TABELA_CHARS_INVALIDOS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_RE_ESPACOS = re.compile(r'\s+')
+_RE_VIEWSTATE = re.compile(r'name="javax\.faces\.ViewState"[^>]*value="([^"]*)"')
+
+# Numeros CNJ: tabela de translate que remove tudo que nao e digito
+# (faixa Latin-1) e numero formatado no inicio do nome de um arquivo
+TABELA_SO_DIGITOS = str.maketrans(
+    '', '', ''.join(chr(i) for i in range(256) if not chr(i).isdecimal())
+)
+RE_CNJ_ARQUIVO = re.compile(r'^(\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4})')
+
+
+def parse_cnj(numero: str) -> Optional[Tuple[str, str, str, str, str, str]]:
+    """
+    Separa um numero CNJ formatado (NNNNNNN-DD.AAAA.J.TR.OOOO) em partes.
+    
+    OTIMIZAÇÃO: formato fixo, entao fatias por posicao substituem a regex.
+    """
+    if (
+        len(numero) != 25
+        or numero[7] != '-' or numero[10] != '.' or numero[15] != '.'
+        or numero[17] != '.' or numero[20] != '.'
+        or not numero.isascii()
+    ):
+        return None
+    partes = (numero[:7], numero[8:10], numero[11:15], numero[16], numero[18:20], numero[21:])
+    if not ''.join(partes).isdigit():
+        return None
+    return partes
 
 
 def delay(min_sec: float = 1.0, max_sec: float = 3.0) -> None:
@@ -21,6 +71,39 @@ def delay(min_sec: float = 1.0, max_sec: float = 3.0) -> None:
     time.sleep(wait_time)
 
 
+class RateLimiter:
+    """
+    Limitador de taxa (token bucket) seguro entre threads.
+    
+    Permite rajadas de ate `rajada` requisicoes e, em regime, no maximo
+    `por_segundo` requisicoes por segundo. Quem excede dorme so o tempo
+    necessario, fora do lock.
+    """
+    
+    def __init__(self, por_segundo: float, rajada: Optional[int] = None):
+        self.por_segundo = por_segundo
+        self.rajada = rajada or max(1, int(por_segundo))
+        self._fichas = float(self.rajada)
+        self._ultimo = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def aguardar(self) -> None:
+        """Consome uma ficha, esperando se o balde estiver vazio."""
+        if self.por_segundo <= 0:
+            return
+        with self._lock:
+            agora = time.monotonic()
+            self._fichas = min(
+                self.rajada, self._fichas + (agora - self._ultimo) * self.por_segundo
+            )
+            self._ultimo = agora
+            # Reserva a ficha ja agora; o saldo negativo e a fila de espera
+            self._fichas -= 1
+            espera = -self._fichas / self.por_segundo if self._fichas < 0 else 0.0
+        if espera > 0:
+            time.sleep(espera)
+
+
 def timestamp_str() -> str:
     """Timestamp para nomes de arquivo."""
     return datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -33,18 +116,41 @@ def current_month_year() -> str:
 
 def normalizar_nome_pasta(nome: str) -> str:
     """Normaliza nome para uso em sistema de arquivos."""
-    nome_normalizado = unicodedata.normalize('NFKD', nome)
-    nome_sem_acento = ''.join(c for c in nome_normalizado if not unicodedata.combining(c))
-    nome_limpo = re.sub(r'[<>:"/\\|?*]', '_', nome_sem_acento)
-    nome_limpo = re.sub(r'\s+', ' ', nome_limpo).strip()
+    if nome.isascii():
+        # Sem acentos possiveis: NFKD e o filtro de combinantes seriam no-op
+        nome_sem_acento = nome
+    else:
+        nome_normalizado = unicodedata.normalize('NFKD', nome)
+        nome_sem_acento = ''.join(c for c in nome_normalizado if not unicodedata.combining(c))
+    nome_limpo = nome_sem_acento.translate(_TABELA_CHARS_INVALIDOS)
+    nome_limpo = _RE_ESPACOS.sub(' ', nome_limpo).strip()
     return nome_limpo
 
 
+@lru_cache(maxsize=4096)
+def _similaridade_normalizada(str1: str, str2: str) -> float:
+    """Similaridade de um par ja em minusculas, sem espacos nas pontas."""
+    # OTIMIZAÇÃO: rapidfuzz calcula a mesma razao em C++. Sem processor:
+    # a entrada ja vem normalizada e o score tem que ser o mesmo do difflib
+    if rf_fuzz is not None:
+        return rf_fuzz.ratio(str1, str2) / 100.0
+    return SequenceMatcher(None, str1, str2).ratio()
+
+
 def calcular_similaridade(str1: str, str2: str) -> float:
     """Calcula similaridade entre duas strings (0.0 a 1.0)."""
+    # OTIMIZAÇÃO: memoizado por par normalizado (reruns da UI repetem as
+    # mesmas comparacoes). So o ratio do rapidfuzz e simetrico: com ele a
+    # ordem e canonica para (a, b) e (b, a) compartilharem a entrada; o do
+    # difflib depende da ordem e o par fica como veio
     str1 = str1.lower().strip()
     str2 = str2.lower().strip()
-    return SequenceMatcher(None, str1, str2).ratio()
+    if rf_fuzz is not None and str2 < str1:
+        str1, str2 = str2, str1
+    return _similaridade_normalizada(str1, str2)
+
+
+calcular_similaridade.cache_clear = _similaridade_normalizada.cache_clear
 
 
 def buscar_texto_similar(
@@ -54,15 +160,30 @@ def buscar_texto_similar(
 ) -> Optional[int]:
     """Busca texto similar em uma lista."""
     busca_lower = busca.lower().strip()
+    # Minusculas calculadas uma unica vez para as duas primeiras passadas
+    lista_lower = [item.lower() for item in lista]
     
-    for i, item in enumerate(lista):
-        if item.lower().strip() == busca_lower:
-            return i
+    try:
+        return [item.strip() for item in lista_lower].index(busca_lower)
+    except ValueError:
+        pass
     
-    for i, item in enumerate(lista):
-        if busca_lower in item.lower():
+    for i, item in enumerate(lista_lower):
+        if busca_lower in item:
             return i
     
+    # OTIMIZAÇÃO: com rapidfuzz, a passada de similaridade roda inteira em
+    # C++, com corte por score (candidatos inviaveis nem sao comparados)
+    # (mesma normalizacao de calcular_similaridade, para o score nao
+    # depender do backend)
+    if rf_process is not None:
+        match = rf_process.extractOne(
+            busca_lower, [item.strip() for item in lista_lower],
+            scorer=rf_fuzz.ratio,
+            score_cutoff=threshold * 100
+        )
+        return match[2] if match else None
+    
     melhor_match = None
     melhor_score = 0.0
     
@@ -77,13 +198,22 @@ def buscar_texto_similar(
 
 def extrair_viewstate(html: str) -> Optional[str]:
     """Extrai ViewState de HTML JSF."""
-    match = re.search(r'name="javax\.faces\.ViewState"[^>]*value="([^"]*)"', html)
+    match = _RE_VIEWSTATE.search(html)
     return match.group(1) if match else None
 
 
 def save_json(data: Any, filepath: Path) -> None:
     """Salva dados em JSON."""
     filepath.parent.mkdir(parents=True, exist_ok=True)
+    # OTIMIZAÇÃO: orjson serializa direto para bytes (bem mais rapido)
+    if orjson is not None:
+        try:
+            filepath.write_bytes(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+            return
+        except TypeError:
+            pass
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
@@ -92,8 +222,8 @@ def load_json(filepath: Path) -> Optional[Any]:
     """Carrega dados de JSON."""
     if not filepath.exists():
         return None
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # OTIMIZAÇÃO: le os bytes de uma vez e decodifica com orjson (se houver)
+    return json_loads(filepath.read_bytes())
 
 
 class PJELogger:
@@ -155,25 +285,46 @@ class PJELogger:
         cls._callbacks.clear()
     
     def _notify_callbacks(self, level: str, msg: str):
-        for callback in self._callbacks:
+        # OTIMIZAÇÃO: sem UI conectada (caso comum), sai sem montar o loop
+        callbacks = PJELogger._callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(level, msg)
             except Exception:
                 pass
     
-    def info(self, msg: str):
+    # Mensagens aceitam formatacao %-lazy: logger.debug("ID=%s", id_processo).
+    # O texto so e montado se algum handler ou callback for recebe-lo.
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Indica se uma mensagem do nivel chegaria a algum handler ou callback."""
+        return bool(self._callbacks) or self.logger.isEnabledFor(level)
+    
+    def info(self, msg: str, *args):
+        if args:
+            msg = msg % args
         self.logger.info(msg)
         self._notify_callbacks("INFO", msg)
     
-    def debug(self, msg: str):
+    def debug(self, msg: str, *args):
+        if not self.isEnabledFor(logging.DEBUG):
+            return
+        if args:
+            msg = msg % args
         self.logger.debug(msg)
         self._notify_callbacks("DEBUG", msg)
     
-    def warning(self, msg: str):
+    def warning(self, msg: str, *args):
+        if args:
+            msg = msg % args
         self.logger.warning(msg)
         self._notify_callbacks("WARNING", msg)
     
-    def error(self, msg: str):
+    def error(self, msg: str, *args):
+        if args:
+            msg = msg % args
         self.logger.error(msg)
         self._notify_callbacks("ERROR", msg)
     
@@ -0,0 +1,129 @@
+"""
+Testes da fase 1 do download por número (ordem e ritmo dos estados).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from pje_lib.services import number_download_service
+from pje_lib.services.number_download_service import NumberDownloadService
+from pje_lib.services.process_search_service import ProcessSearchService, ResultadoBusca
+
+
+NUMEROS = [f"000000{i}-02.2023.8.05.0001" for i in range(1, 6)]
+
+
+class ClienteFalso:
+    def ajustar_pool(self, pool_size):
+        pass
+
+
+class BuscaFalsa:
+    """Encontra todos os números, exceto os marcados como ausentes/inconclusivos."""
+
+    def __init__(self, ausentes=(), inconclusivos=()):
+        self.ausentes = set(ausentes)
+        self.inconclusivos = set(inconclusivos)
+
+    def limpar_cache(self):
+        pass
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _normalizar_numero(numero):
+        return ProcessSearchService._normalizar_numero(numero)
+
+    def buscar_processo(self, numero):
+        if numero in self.ausentes:
+            return ResultadoBusca(numero_processo=numero)
+        if numero in self.inconclusivos:
+            return ResultadoBusca(numero_processo=numero, inconclusivo=True)
+        return ResultadoBusca(encontrado=True, id_processo=int(numero[:7]), numero_processo=numero)
+
+
+class DownloadFalso:
+    """Grava o PDF direto no diretório, como o download direto (S3)."""
+
+    def limpar_diagnosticos(self):
+        pass
+
+    def solicitar_download(self, id_processo, numero, tipo_documento, diretorio_download=None):
+        arquivo = diretorio_download / f"{numero}.pdf"
+        arquivo.write_bytes(b"%PDF")
+        return True, {"arquivo_baixado": arquivo}
+
+
+@pytest.fixture
+def criar_servico(tmp_path):
+    def criar(busca=None):
+        servico = NumberDownloadService(
+            ClienteFalso(), DownloadFalso(), tmp_path, search_service=busca or BuscaFalsa()
+        )
+        servico.retry_delay = 0
+        return servico
+    return criar
+
+
+def test_estados_seguem_a_ordem_das_fases(criar_servico):
+    servico = criar_servico()
+    estados = list(servico.processar_generator(NUMEROS, aguardar_download=False))
+
+    status = [e["status"] for e in estados]
+    assert status[0] == "iniciando"
+    assert status.index("buscando_processo") < status.index("verificando_integridade")
+    assert status[-1] == "concluido"
+
+    final = estados[-1]
+    assert final["sucesso"] == len(NUMEROS)
+    assert final["falha"] == 0
+    assert sorted(final["arquivos"]) == sorted(
+        str(Path(final["diretorio"]) / f"{n}.pdf") for n in NUMEROS
+    )
+
+
+def test_cada_estado_e_um_snapshot_independente(criar_servico):
+    estados = list(criar_servico().processar_generator(NUMEROS, aguardar_download=False))
+
+    assert len({id(e) for e in estados}) == len(estados)
+    assert estados[0]["status"] == "iniciando"
+    progresso = [e["progresso"] for e in estados]
+    assert progresso == sorted(progresso)
+
+
+def test_yields_da_fase_1_sao_agrupados(criar_servico, monkeypatch):
+    # Intervalo enorme: entrada na fase, primeira e última conclusões
+    monkeypatch.setattr(number_download_service, "_INTERVALO_MIN_YIELD", 3600)
+    estados = list(criar_servico().processar_generator(NUMEROS, aguardar_download=False))
+    fase_1 = [e for e in estados if e["status"] == "buscando_processo"]
+    assert [e["progresso"] for e in fase_1] == [0, 1, len(NUMEROS)]
+
+
+def test_yields_da_fase_1_sem_agrupamento(criar_servico, monkeypatch):
+    monkeypatch.setattr(number_download_service, "_INTERVALO_MIN_YIELD", 0)
+    estados = list(criar_servico().processar_generator(NUMEROS, aguardar_download=False))
+    fase_1 = [e for e in estados if e["status"] == "buscando_processo"]
+    assert [e["progresso"] for e in fase_1] == list(range(len(NUMEROS) + 1))
+
+
+def test_busca_inconclusiva_nao_e_relatada_como_nao_encontrado(criar_servico):
+    busca = BuscaFalsa(ausentes=[NUMEROS[0]], inconclusivos=[NUMEROS[1]])
+    servico = criar_servico(busca)
+    servico.max_retries = 0
+
+    final = list(servico.processar_generator(NUMEROS, aguardar_download=False))[-1]
+
+    assert f"Processo não encontrado: {NUMEROS[0]}" in final["erros"]
+    assert f"Busca inconclusiva (tempo esgotado): {NUMEROS[1]}" in final["erros"]
+    assert f"Processo não encontrado: {NUMEROS[1]}" not in final["erros"]
+    assert final["sucesso"] == len(NUMEROS) - 2
+
+
+def test_numero_invalido_e_registrado(criar_servico):
+    final = list(criar_servico().processar_generator(["123", NUMEROS[0]], aguardar_download=False))[-1]
+
+    assert "Número inválido: 123" in final["erros"]
+    assert final["processos"] == 2
+    assert final["sucesso"] == 1
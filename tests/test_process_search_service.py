@@ -0,0 +1,145 @@
+"""
+Testes do prazo e do cancelamento das estratégias de busca.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pje_lib.core import PJEHttpClient
+from pje_lib.services import process_search_service
+from pje_lib.services.process_search_service import ProcessSearchService, ResultadoBusca
+
+
+NUMERO = "0000001-02.2023.8.05.0001"
+
+
+@pytest.fixture
+def servico():
+    servico = ProcessSearchService(
+        PJEHttpClient(), salvar_debug_html=False, cache_persistente=False
+    )
+    servico.timeout_por_metodo = 0.3
+    yield servico
+    servico.close()
+
+
+def _nao_encontrado(numero):
+    return ResultadoBusca(numero_processo=numero)
+
+
+def _encontrado(id_processo):
+    def buscar(numero):
+        return ResultadoBusca(encontrado=True, id_processo=id_processo, numero_processo=numero)
+    return buscar
+
+
+def _lento(segundos, resultado=_nao_encontrado):
+    def buscar(numero):
+        time.sleep(segundos)
+        return resultado(numero)
+    return buscar
+
+
+def test_primeiro_metodo_que_encontra_vence(servico):
+    servico._buscar_via_api_processo = _lento(0.5, _encontrado(1))
+    servico._buscar_via_painel_tarefas = _encontrado(2)
+
+    resultado = servico._executar_busca(NUMERO, ["api_processo", "painel_tarefas"], False)
+
+    assert resultado.encontrado
+    assert resultado.id_processo == 2
+
+
+def test_nao_encontrado_definitivo(servico):
+    servico._buscar_via_api_processo = _nao_encontrado
+
+    resultado = servico._executar_busca(NUMERO, ["api_processo"], False)
+
+    assert not resultado.encontrado
+    assert not resultado.inconclusivo
+
+
+def test_metodo_parado_deixa_busca_inconclusiva(servico):
+    servico._buscar_via_api_processo = _lento(1.0)
+
+    inicio = time.monotonic()
+    resultado = servico._executar_busca(NUMERO, ["api_processo"], False)
+
+    assert time.monotonic() - inicio < 0.9
+    assert not resultado.encontrado
+    assert resultado.inconclusivo
+
+
+def test_busca_inconclusiva_nao_vai_para_o_cache(servico):
+    servico._buscar_via_api_processo = _lento(1.0)
+
+    servico._executar_busca(NUMERO, ["api_processo"], True)
+
+    assert servico._ler_cache_memoria(NUMERO) is None
+
+
+def test_espera_na_fila_nao_conta_no_prazo(servico):
+    # Um único worker: painel_tarefas só começa quando api_processo termina,
+    # depois do prazo de um método
+    servico._executor = ThreadPoolExecutor(max_workers=1)
+    servico._buscar_via_api_processo = _lento(0.5)
+    servico._buscar_via_painel_tarefas = _encontrado(7)
+
+    resultado = servico._executar_busca(NUMERO, ["api_processo", "painel_tarefas"], False)
+
+    assert resultado.encontrado
+    assert resultado.id_processo == 7
+
+
+def test_metodo_com_progresso_nao_expira(servico):
+    def buscar(numero):
+        # Cinco consultas de 0,15 s: 0,75 s no total, nunca 0,3 s parado
+        for _ in range(5):
+            servico._submeter_consulta(time.sleep, 0.15).result()
+        return _encontrado(9)(numero)
+    servico._buscar_via_api_processo = buscar
+
+    resultado = servico._executar_busca(NUMERO, ["api_processo"], False)
+
+    assert resultado.encontrado
+    assert resultado.id_processo == 9
+
+
+def test_metodos_na_fila_sao_cancelados_quando_um_encontra(servico):
+    servico._executor = ThreadPoolExecutor(max_workers=1)
+    executou = threading.Event()
+
+    def painel(numero):
+        executou.set()
+        return _nao_encontrado(numero)
+    servico._buscar_via_api_processo = _encontrado(3)
+    servico._buscar_via_painel_tarefas = painel
+
+    resultado = servico._executar_busca(NUMERO, ["api_processo", "painel_tarefas"], False)
+
+    assert resultado.id_processo == 3
+    assert not executou.wait(0.2)
+
+
+def test_quem_aguarda_busca_travada_nao_trava(servico, monkeypatch):
+    monkeypatch.setattr(process_search_service, "TIMEOUT_MAXIMO_BUSCA", 0.2)
+    liberar = threading.Event()
+
+    def travada(numero, metodos, usar_cache):
+        liberar.wait(5)
+        return _nao_encontrado(numero)
+    servico._executar_busca = travada
+
+    dono = threading.Thread(target=servico.buscar_processo, args=(NUMERO, False))
+    dono.start()
+    try:
+        time.sleep(0.05)
+        resultado = servico.buscar_processo(NUMERO, False)
+        assert not resultado.encontrado
+        assert resultado.inconclusivo
+    finally:
+        liberar.set()
+        dono.join()
@@ -0,0 +1,88 @@
+"""
+Testes do RateLimiter (token bucket).
+"""
+
+import threading
+import time
+
+import pytest
+
+from pje_lib import utils
+from pje_lib.utils import RateLimiter
+
+
+class RelogioFalso:
+    """Substitui o modulo time dentro de pje_lib.utils: sleep avanca o relogio."""
+
+    def __init__(self):
+        self.agora = 1000.0
+        self.esperas = []
+
+    def monotonic(self) -> float:
+        return self.agora
+
+    def sleep(self, segundos: float) -> None:
+        self.esperas.append(segundos)
+        self.agora += segundos
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    relogio = RelogioFalso()
+    monkeypatch.setattr(utils, "time", relogio)
+    return relogio
+
+
+def test_rajada_nao_espera(relogio):
+    limitador = RateLimiter(por_segundo=5, rajada=3)
+    for _ in range(3):
+        limitador.aguardar()
+    assert relogio.esperas == []
+
+
+def test_excedente_espera_o_intervalo(relogio):
+    limitador = RateLimiter(por_segundo=4, rajada=1)
+    limitador.aguardar()
+    limitador.aguardar()
+    limitador.aguardar()
+    assert relogio.esperas == pytest.approx([0.25, 0.25])
+
+
+def test_fichas_recarregam_com_o_tempo(relogio):
+    limitador = RateLimiter(por_segundo=2, rajada=2)
+    limitador.aguardar()
+    limitador.aguardar()
+    relogio.agora += 1.0  # recarrega as duas fichas
+    limitador.aguardar()
+    limitador.aguardar()
+    assert relogio.esperas == []
+
+
+def test_rajada_nao_acumula_acima_do_limite(relogio):
+    limitador = RateLimiter(por_segundo=1, rajada=2)
+    relogio.agora += 60.0
+    for _ in range(3):
+        limitador.aguardar()
+    assert relogio.esperas == pytest.approx([1.0])
+
+
+def test_taxa_zero_desativa(relogio):
+    limitador = RateLimiter(por_segundo=0)
+    for _ in range(10):
+        limitador.aguardar()
+    assert relogio.esperas == []
+
+
+def test_respeita_a_taxa_entre_threads():
+    limitador = RateLimiter(por_segundo=100, rajada=1)
+    inicio = time.monotonic()
+    threads = [
+        threading.Thread(target=lambda: [limitador.aguardar() for _ in range(5)])
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 20 requisicoes, 1 de rajada: ao menos 19 intervalos de 10 ms
+    assert time.monotonic() - inicio >= 0.18